@@ -3,12 +3,16 @@
 Analyze graduation retention patterns for WSA members
 """
 
-from src.data_processor import DataProcessor
-from src.graduation_analyzer import GraduationAnalyzer
-import json
+import argparse
+import sys
 from pathlib import Path
 
 def main():
+    # Imported here so `--help` returns without loading pandas and the analyzers
+    from src.data_processor import DataProcessor
+    from src.graduation_analyzer import GraduationAnalyzer
+    from src.report_writer import save_json_report
+    
     # Initialize analyzers
     processor = DataProcessor()
     processor.preprocess_data()
@@ -42,11 +46,7 @@ def main():
     print(f"✅ Detailed graduation analysis exported to: {export_path}")
     
     # Save JSON report
-    reports_dir = Path("reports")
-    reports_dir.mkdir(exist_ok=True)
-    
-    with open(reports_dir / "graduation_retention_analysis.json", 'w') as f:
-        json.dump(comparison, f, indent=2, default=str)
+    save_json_report(comparison, Path("reports") / "graduation_retention_analysis.json")
     
     print(f"✅ JSON report saved to: reports/graduation_retention_analysis.json")
 
@@ -55,39 +55,41 @@ def display_graduation_analysis(analysis):
     year = analysis['year']
     total = analysis['total_analyzed']
     
-    print(f"Total members analyzed: {total}")
-    print()
+    # Build the whole report first and write it to stdout in one call
+    lines = [f"Total members analyzed: {total}", ""]
     
     # Distribution
-    print("Graduation Status Distribution:")
+    lines.append("Graduation Status Distribution:")
+    percentages = analysis['graduation_percentages']
     for status, count in analysis['graduation_distribution'].items():
-        percentage = (count / total) * 100
-        print(f"  {status}: {count} ({percentage:.1f}%)")
+        lines.append(f"  {status}: {count} ({percentages[status]:.1f}%)")
     
-    print()
-    print("Retention by Graduation Status:")
-    print("-" * 70)
+    lines.append("")
+    lines.append("Retention by Graduation Status:")
+    lines.append("-" * 70)
     
     for grad_status, data in analysis['by_graduation_status'].items():
-        print(f"\n🎓 {grad_status.upper()} ({data['total_members']} members)")
+        lines.append(f"\n🎓 {grad_status.upper()} ({data['total_members']} members)")
         
         retention = data['retention_percentages']
-        print(f"  • Still in PEI: {retention['Still in PEI']:.1f}%")
-        print(f"  • No longer in PEI: {retention['No longer in PEI']:.1f}%") 
-        print(f"  • Inconclusive: {retention['Inconclusive']:.1f}%")
+        lines.append(f"  • Still in PEI: {retention['Still in PEI']:.1f}%")
+        lines.append(f"  • No longer in PEI: {retention['No longer in PEI']:.1f}%")
+        lines.append(f"  • Inconclusive: {retention['Inconclusive']:.1f}%")
     
-    print()
-    print("Key Insights:")
+    lines.append("")
+    lines.append("Key Insights:")
     for insight in analysis['key_insights']:
-        print(f"  ✨ {insight}")
+        lines.append(f"  ✨ {insight}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def display_yoy_comparison(comparison):
     """Display year-over-year comparison."""
     if 'year_over_year_changes' in comparison:
         changes = comparison['year_over_year_changes']
         
-        print("Retention Rate Changes (2023 → 2024):")
-        print("-" * 50)
+        # Build the whole report first and write it to stdout in one call
+        lines = ["Retention Rate Changes (2023 → 2024):", "-" * 50]
         
         for grad_status, change_data in changes.items():
             retention_2023 = change_data['2023_retention']
@@ -96,22 +98,33 @@ def display_yoy_comparison(comparison):
             
             trend = "↗️" if change > 0 else "↘️" if change < 0 else "→"
             
-            print(f"{grad_status}:")
-            print(f"  2023: {retention_2023:.1f}% → 2024: {retention_2024:.1f}% ({change:+.1f}%) {trend}")
+            lines.append(f"{grad_status}:")
+            lines.append(f"  2023: {retention_2023:.1f}% → 2024: {retention_2024:.1f}% ({change:+.1f}%) {trend}")
         
-        print()
+        lines.append("")
         
         # Summary insights
         grad_change = changes.get('Graduate', {}).get('retention_change', 0)
         student_change = changes.get('Current Student', {}).get('retention_change', 0)
         
-        print("Summary Insights:")
+        lines.append("Summary Insights:")
         if grad_change > student_change:
-            print(f"  🎯 Graduates showed better retention improvement (+{grad_change:.1f}% vs +{student_change:.1f}%)")
+            lines.append(f"  🎯 Graduates showed better retention improvement (+{grad_change:.1f}% vs +{student_change:.1f}%)")
         elif student_change > grad_change:
-            print(f"  🎯 Current students showed better retention improvement (+{student_change:.1f}% vs +{grad_change:.1f}%)")
+            lines.append(f"  🎯 Current students showed better retention improvement (+{student_change:.1f}% vs +{grad_change:.1f}%)")
         else:
-            print(f"  🎯 Both groups showed similar retention changes")
+            lines.append(f"  🎯 Both groups showed similar retention changes")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Analyze retention of graduates vs current students for 2023 and 2024."
+    )
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
+    parse_args()
     main() 
\ No newline at end of file
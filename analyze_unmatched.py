@@ -6,25 +6,55 @@ This script analyzes and improves matching for WSA retention data,
 specifically addressing the issue of unmatched members in 2024.
 """
 
+import argparse
 import sys
-import json
-import pandas as pd
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
 import logging
 
 # Add src to path so we can import our modules
 sys.path.append('src')
 
-from data_processor import DataProcessor
-from matching_analyzer import MatchingAnalyzer
+# The analysis modules (and pandas with them) are imported inside main() and
+# analyze_year_comparison() so `--help` returns without paying their import cost
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Per-year results shared between main() and analyze_year_comparison()
+_unmatched_cache = {}
+_improved_cache = {}
+
+
+def banner(title):
+    """Return a section banner: the title framed by rules of '='."""
+    rule = "=" * 50
+    return f"\n{rule}\n{title}\n{rule}\n"
+
+
+def get_unmatched_analysis(analyzer, year):
+    """Return the unmatched-records analysis for a year, computing it at most once."""
+    if year not in _unmatched_cache:
+        _unmatched_cache[year] = analyzer.analyze_unmatched_records(year)
+    return _unmatched_cache[year]
+
+
+def get_improved_matching(analyzer, year, confidence_threshold=75):
+    """Return improved matching results for a year/threshold, computing them at most once."""
+    key = (year, confidence_threshold)
+    if key not in _improved_cache:
+        _improved_cache[key] = analyzer.improved_matching(year, confidence_threshold=confidence_threshold)
+    return _improved_cache[key]
+
 
 def main():
     """Main function to analyze and improve matching."""
+    from data_processor import DataProcessor
+    from matching_analyzer import MatchingAnalyzer
+    from report_writer import save_json_report
+    
     print("🔍 WSA Retention Analysis - Unmatched Records Investigation")
     print("=" * 70)
     
@@ -41,11 +71,9 @@ def main():
         print(f"\n🎯 Analyzing unmatched records for {year}...")
         
         # Step 1: Analyze current unmatched records
-        print("\n" + "="*50)
-        print("STEP 1: ANALYZING UNMATCHED RECORDS")
-        print("="*50)
+        sys.stdout.write(banner("STEP 1: ANALYZING UNMATCHED RECORDS"))
         
-        unmatched_analysis = analyzer.analyze_unmatched_records(year)
+        unmatched_analysis = get_unmatched_analysis(analyzer, year)
         
         print(f"\n📈 CURRENT MATCHING STATISTICS FOR {year}:")
         print(f"   Total Registrations: {unmatched_analysis['total_registrations']}")
@@ -60,27 +88,24 @@ def main():
             print(f"   {inst}: {count} unmatched")
         
         print(f"\n🌍 UNMATCHED BY COUNTRY:")
-        for country, count in list(patterns['by_country'].items())[:5]:
+        for country, count in nlargest(5, patterns['by_country'].items(), key=itemgetter(1)):
             print(f"   {country}: {count} unmatched")
         
         print(f"\n📧 UNMATCHED BY EMAIL DOMAIN:")
-        for domain, count in list(patterns['by_email_domain'].items())[:5]:
+        for domain, count in nlargest(5, patterns['by_email_domain'].items(), key=itemgetter(1)):
             print(f"   {domain}: {count} unmatched")
         
         # Step 2: Run improved matching
-        print("\n" + "="*50)
-        print("STEP 2: RUNNING IMPROVED MATCHING ALGORITHM")
-        print("="*50)
+        sys.stdout.write(banner("STEP 2: RUNNING IMPROVED MATCHING ALGORITHM"))
         
         print("🔄 Running improved matching with multiple strategies...")
-        improved_results = analyzer.improved_matching(year, confidence_threshold=75)
+        improved_results = get_improved_matching(analyzer, year, confidence_threshold=75)
         
         # Step 3: Generate comprehensive report
-        print("\n" + "="*50)
-        print("STEP 3: GENERATING MATCHING REPORT")
-        print("="*50)
+        sys.stdout.write(banner("STEP 3: GENERATING MATCHING REPORT"))
         
-        report = analyzer.generate_matching_report(year)
+        report = analyzer.generate_matching_report(year, improved_results=improved_results,
+                                                   unmatched_analysis=unmatched_analysis)
         
         print(f"\n📊 MATCHING IMPROVEMENT RESULTS:")
         print(f"   Original Match Rate: {report['original_stats']['match_rate']:.1f}%")
@@ -91,54 +116,43 @@ def main():
         remaining_unmatched = report['improved_stats']['unmatched']
         print(f"   Remaining Unmatched: {remaining_unmatched}")
         
-        # Step 4: Export unmatched for manual review
-        print("\n" + "="*50)
-        print("STEP 4: EXPORTING UNMATCHED RECORDS FOR MANUAL REVIEW")
-        print("="*50)
-        
-        if remaining_unmatched > 0:
-            export_path = analyzer.export_unmatched_for_manual_review(year)
-            print(f"✅ Exported {remaining_unmatched} unmatched records to: {export_path}")
-            print(f"📝 This file includes LinkedIn-ready names and columns for manual status updates")
-            print(f"🔍 Use this file to research members on LinkedIn and social media")
-        else:
-            print("🎉 All records have been matched! No manual review needed.")
-        
-        # Step 5: Save detailed analysis report
-        print("\n" + "="*50)
-        print("STEP 5: SAVING DETAILED ANALYSIS REPORT")
-        print("="*50)
-        
-        # Create reports directory
-        reports_dir = Path("reports")
-        reports_dir.mkdir(exist_ok=True)
+        # Step 4: Save detailed analysis report
+        sys.stdout.write(banner("STEP 4: SAVING DETAILED ANALYSIS REPORT"))
         
         # Save matching report
-        report_path = reports_dir / f"matching_analysis_{year}.json"
-        with open(report_path, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        report_path = save_json_report(report, Path("reports") / f"matching_analysis_{year}.json")
         
         print(f"💾 Detailed report saved to: {report_path}")
         
-        # Step 6: Show recommendations
-        print("\n" + "="*50)
-        print("STEP 6: RECOMMENDATIONS")
-        print("="*50)
-        
-        print("\n🎯 RECOMMENDED ACTIONS:")
-        for i, recommendation in enumerate(report['recommendations'], 1):
-            print(f"   {i}. {recommendation}")
-        
-        # Step 7: Show potential matches for manual review
-        if unmatched_analysis['potential_matches']:
-            print(f"\n🔍 POTENTIAL MATCHES FOUND (Top 10):")
-            for i, match in enumerate(unmatched_analysis['potential_matches'][:10], 1):
-                print(f"\n   {i}. Registration: {match['registration_name']}")
-                print(f"      Email: {match['registration_email']}")
-                print(f"      Potential Matches:")
-                for potential in match['potential_matches'][:2]:  # Show top 2
-                    print(f"        - {potential['matched_name']} ({potential['type']}, {potential['score']}% confidence)")
-                    print(f"          Status: {potential['status']}")
+        if remaining_unmatched == 0:
+            # Nothing left to export, recommend or review
+            print("\n🎉 All records have been matched! No manual review needed.")
+        else:
+            # Step 5: Export unmatched for manual review
+            sys.stdout.write(banner("STEP 5: EXPORTING UNMATCHED RECORDS FOR MANUAL REVIEW"))
+            
+            export_path = analyzer.export_unmatched_for_manual_review(year)
+            print(f"✅ Exported {remaining_unmatched} unmatched records to: {export_path}")
+            print(f"📝 This file includes LinkedIn-ready names and columns for manual status updates")
+            print(f"🔍 Use this file to research members on LinkedIn and social media")
+            
+            # Step 6: Show recommendations
+            sys.stdout.write(banner("STEP 6: RECOMMENDATIONS"))
+            
+            print("\n🎯 RECOMMENDED ACTIONS:")
+            for i, recommendation in enumerate(report['recommendations'], 1):
+                print(f"   {i}. {recommendation}")
+            
+            # Step 7: Show potential matches for manual review
+            if unmatched_analysis['potential_matches']:
+                print(f"\n🔍 POTENTIAL MATCHES FOUND (Top 10):")
+                for i, match in enumerate(unmatched_analysis['potential_matches'][:10], 1):
+                    print(f"\n   {i}. Registration: {match['registration_name']}")
+                    print(f"      Email: {match['registration_email']}")
+                    print(f"      Potential Matches:")
+                    for potential in match['potential_matches'][:2]:  # Show top 2
+                        print(f"        - {potential['matched_name']} ({potential['type']}, {potential['score']}% confidence)")
+                        print(f"          Status: {potential['status']}")
         
         print(f"\n" + "="*70)
         print("ANALYSIS COMPLETE!")
@@ -147,7 +161,8 @@ def main():
         print(f"   • Original unmatched: {report['original_stats']['unmatched']}")
         print(f"   • Improved matching found: {report['improvements']['additional_matches']} additional matches")
         print(f"   • Still need manual review: {remaining_unmatched}")
-        print(f"   • Export file created for LinkedIn research")
+        if remaining_unmatched > 0:
+            print(f"   • Export file created for LinkedIn research")
         print(f"   • Detailed report saved to {report_path}")
         
         if remaining_unmatched > 0:
@@ -167,6 +182,9 @@ def main():
 
 def analyze_year_comparison():
     """Compare matching quality between 2023 and 2024."""
+    from data_processor import DataProcessor
+    from matching_analyzer import MatchingAnalyzer
+    
     print("\n🔬 COMPARING MATCHING QUALITY: 2023 vs 2024")
     print("="*50)
     
@@ -177,12 +195,12 @@ def analyze_year_comparison():
         # Analyze both years
         for year in [2023, 2024]:
             print(f"\n📊 {year} Analysis:")
-            analysis = analyzer.analyze_unmatched_records(year)
+            analysis = get_unmatched_analysis(analyzer, year)
             print(f"   Total: {analysis['total_registrations']}")
             print(f"   Unmatched: {analysis['total_unmatched']} ({analysis['unmatched_percentage']:.1f}%)")
             
             # Try improved matching
-            improved = analyzer.improved_matching(year)
+            improved = get_improved_matching(analyzer, year)
             original_matched = analysis['total_registrations'] - analysis['total_unmatched']
             improved_matched = len(improved[improved['retention_status'] != 'Unknown'])
             additional = improved_matched - original_matched
@@ -194,11 +212,24 @@ def analyze_year_comparison():
         print(f"Error in comparison: {e}")
 
 
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Analyze unmatched WSA members and try improved matching strategies."
+    )
+    parser.add_argument(
+        "--compare", action="store_true",
+        help="also compare matching quality between 2023 and 2024"
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    args = parse_args()
     exit_code = main()
     
     # Optionally run year comparison
-    if len(sys.argv) > 1 and sys.argv[1] == "--compare":
+    if args.compare:
         analyze_year_comparison()
     
     sys.exit(exit_code) 
\ No newline at end of file
@@ -6,93 +6,280 @@ This script checks for common data quality issues that can cause
 poor matching rates between registration and retention survey data.
 """
 
+import argparse
 import sys
-import pandas as pd
 import re
 from pathlib import Path
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
 
 # Add src to path
 sys.path.append('src')
-from data_processor import DataProcessor
+
+# pandas, pyarrow and the data processor are imported inside the functions that
+# need them so `--help` returns without paying their import cost
+
+# Patterns shared by the name/email quality checks, compiled once
+DIGIT_RE = re.compile(r'\d')
+NAME_SPECIAL_RE = re.compile(r'[^\w\s\-\.]')
+# Applied with fullmatch so a trailing newline is rejected, as Arrow's regex engine does
+EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Text columns converted to Arrow-backed strings before the checks run
+STRING_COLUMNS = ['Name', 'Email', 'Email Address', 'Institution of Study', 'Province']
+
+# Normalized (lowercased, stripped) spellings of the PEI province
+PEI_PROVINCES = frozenset(
+    var.lower().strip() for var in [
+        'Prince Edward Island', 'Prince-Edward-Island', 'PEI',
+        'P.E.I.', 'Prince Edward Island, Canada', 'PE'
+    ]
+)
 
 
 def check_name_quality(df, name_col):
     """Check quality of name data."""
+    import pandas as pd
+    
     issues = []
     
+    # Single pass over the column instead of one pandas scan per check
+    missing = short_names = names_with_numbers = names_with_special = 0
+    names = df[name_col]
+    for name in names.to_numpy(dtype=object):
+        if isinstance(name, str):
+            if len(name) < 3:
+                short_names += 1
+            if DIGIT_RE.search(name):
+                names_with_numbers += 1
+            if NAME_SPECIAL_RE.search(name):
+                names_with_special += 1
+        elif pd.isna(name):
+            missing += 1
+    
+    # Same count as duplicated().sum() from one hash pass, without a boolean mask
+    duplicates = len(names) - names.nunique(dropna=False)
+    
     # Missing names
-    missing = df[name_col].isna().sum()
     if missing > 0:
         issues.append(f"Missing names: {missing}")
     
     # Very short names (likely incomplete)
-    short_names = df[df[name_col].str.len() < 3].shape[0]
     if short_names > 0:
         issues.append(f"Very short names (< 3 chars): {short_names}")
     
     # Names with numbers (potential data entry errors)
-    names_with_numbers = df[df[name_col].str.contains(r'\d', na=False)].shape[0]
     if names_with_numbers > 0:
         issues.append(f"Names containing numbers: {names_with_numbers}")
     
     # Names with excessive special characters
-    names_with_special = df[df[name_col].str.contains(r'[^\w\s\-\.]', na=False)].shape[0]
     if names_with_special > 0:
         issues.append(f"Names with special characters: {names_with_special}")
     
     # Duplicate names (potential data entry issues)
-    duplicates = df[name_col].duplicated().sum()
     if duplicates > 0:
         issues.append(f"Duplicate names: {duplicates}")
     
     return issues
 
 
-def check_email_quality(df, email_col):
-    """Check quality of email data."""
+def extract_domains(series):
+    """Return the email domain (text after the first '@') for each value, or None."""
+    import numpy as np
+    
+    domains = []
+    for email in series.to_numpy(dtype=object):
+        if isinstance(email, str):
+            _, at, domain = email.partition('@')
+            domain = domain.partition('\n')[0]
+            domains.append(domain if at and domain else None)
+        else:
+            domains.append(None)
+    return np.array(domains, dtype=object)
+
+
+def check_email_quality(df, email_col, domains=None):
+    """Check quality of email data, optionally reusing precomputed domains."""
+    import pandas as pd
+    
     issues = []
     
+    # Single pass over the column instead of one pandas scan per check
+    missing = invalid_emails = 0
+    emails = df[email_col]
+    for email in emails.to_numpy(dtype=object):
+        if isinstance(email, str):
+            if not EMAIL_RE.fullmatch(email):
+                invalid_emails += 1
+        else:
+            if pd.isna(email):
+                missing += 1
+            invalid_emails += 1
+    
+    # Same count as duplicated().sum() from one hash pass, without a boolean mask
+    duplicates = len(emails) - emails.nunique(dropna=False)
+    
     # Missing emails
-    missing = df[email_col].isna().sum()
     if missing > 0:
         issues.append(f"Missing emails: {missing}")
     
     # Invalid email format
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    invalid_emails = df[~df[email_col].str.match(email_pattern, na=False)].shape[0]
     if invalid_emails > 0:
         issues.append(f"Invalid email format: {invalid_emails}")
     
     # Duplicate emails
-    duplicates = df[email_col].duplicated().sum()
     if duplicates > 0:
         issues.append(f"Duplicate emails: {duplicates}")
     
     # Analyze email domains
-    domains = df[email_col].str.extract(r'@(.+)')[0].value_counts()
+    if domains is None:
+        domains = extract_domains(df[email_col])
+    domain_counts = pd.Series(domains, dtype=object).value_counts()
     
-    return issues, domains
+    return issues, domain_counts
 
 
 def check_institution_consistency(df, inst_col):
     """Check institution name consistency."""
     institutions = df[inst_col].value_counts()
     
-    # Look for potential duplicates with slight variations
-    inst_names = institutions.index.tolist()
-    potential_duplicates = []
+    # Look for potential duplicates with slight variations by grouping on a normalized key
+    buckets = defaultdict(list)
+    for name in institutions.index:
+        buckets[name.lower().replace(' ', '')].append(name)
     
-    for i, name1 in enumerate(inst_names):
-        for name2 in inst_names[i+1:]:
-            if name1.lower().replace(' ', '') == name2.lower().replace(' ', ''):
-                potential_duplicates.append((name1, name2))
+    potential_duplicates = [
+        pair
+        for names in buckets.values() if len(names) > 1
+        for pair in combinations(names, 2)
+    ]
     
     return institutions, potential_duplicates
 
 
+def is_pei_province(province):
+    """Return True if a Province value is one of the PEI spellings."""
+    return isinstance(province, str) and province.lower().strip() in PEI_PROVINCES
+
+
+def check_registration_year(reg_df):
+    """
+    Run every quality check for one year of registrations.
+    
+    Runs in a worker process, so it only returns plain results and prints nothing.
+    """
+    import numpy as np
+    
+    result = {}
+    
+    result['domain_values'] = extract_domains(reg_df['Email'])
+    result['email_issues'], result['email_domains'] = check_email_quality(
+        reg_df, 'Email', result['domain_values']
+    )
+    result['name_issues'] = check_name_quality(reg_df, 'Name')
+    result['institutions'], result['potential_dups'] = check_institution_consistency(
+        reg_df, 'Institution of Study'
+    )
+    
+    result['has_province'] = 'Province' in reg_df.columns
+    if result['has_province']:
+        # One grouping pass; the non-PEI breakdown is derived by filtering its keys
+        province_counts = reg_df['Province'].value_counts(dropna=False)
+        result['province_counts'] = province_counts
+        
+        # Missing provinces count as non-PEI but are not listed in the breakdown
+        non_pei_keys = [not is_pei_province(p) for p in province_counts.index]
+        non_pei_counts = province_counts[non_pei_keys]
+        result['non_pei_total'] = int(non_pei_counts.sum())
+        result['non_pei_province_counts'] = non_pei_counts[non_pei_counts.index.notna()]
+        
+        # Keep some examples if not too many
+        result['non_pei_examples'] = []
+        if 0 < result['non_pei_total'] <= 10:
+            provinces = reg_df['Province'].to_numpy(dtype=object)
+            non_pei_mask = np.fromiter(
+                (not is_pei_province(p) for p in provinces),
+                dtype=bool, count=len(provinces)
+            )
+            examples = reg_df[non_pei_mask].head(5)
+            result['non_pei_examples'] = list(zip(
+                examples['Name'].to_numpy(dtype=object), examples['Province'].to_numpy(dtype=object)
+            ))
+    
+    return result
+
+
+def print_registration_report(year, result):
+    """Print the quality check results for one year of registrations."""
+    import pandas as pd
+    
+    print(f"\n" + "="*60)
+    print(f"{year} REGISTRATIONS QUALITY CHECK")
+    print("="*60)
+    
+    print("\n📧 Email Quality:")
+    if result['email_issues']:
+        for issue in result['email_issues']:
+            print(f"   ⚠️  {issue}")
+    else:
+        print("   ✅ No email issues found")
+    
+    print(f"\n📧 Email Domains (Top 5):")
+    for domain, count in result['email_domains'].head().items():
+        print(f"   {domain}: {count} emails")
+    
+    print("\n👤 Name Quality:")
+    if result['name_issues']:
+        for issue in result['name_issues']:
+            print(f"   ⚠️  {issue}")
+    else:
+        print("   ✅ No name issues found")
+    
+    print(f"\n🏫 Institution Analysis:")
+    institutions = result['institutions']
+    print(f"   Total institutions: {len(institutions)}")
+    for inst, count in institutions.items():
+        print(f"   {inst}: {count} students")
+    
+    if result['potential_dups']:
+        print(f"\n   ⚠️  Potential duplicate institutions:")
+        for dup1, dup2 in result['potential_dups']:
+            print(f"      '{dup1}' vs '{dup2}'")
+    
+    # Check province distribution and non-PEI students
+    print(f"\n📍 Province/Location Analysis:")
+    if result['has_province']:
+        print(f"   Province Distribution:")
+        for province, count in result['province_counts'].items():
+            if pd.isna(province):
+                print(f"      Missing/Unknown: {count}")
+            else:
+                print(f"      {province}: {count}")
+        
+        if result['non_pei_total'] > 0:
+            print(f"\n   🚨 NON-PEI STUDENTS FOUND: {result['non_pei_total']} students")
+            print(f"      These will be automatically filtered out:")
+            for province, count in result['non_pei_province_counts'].items():
+                print(f"         - {province}: {count} students")
+            
+            # Show some examples if not too many
+            if result['non_pei_examples']:
+                print(f"      Example names:")
+                for name, province in result['non_pei_examples']:
+                    print(f"         - {name} ({province})")
+        else:
+            print(f"   ✅ All students are from PEI")
+    else:
+        print(f"   ℹ️  No Province column found - filtering by institution only")
+
+
 def main():
     """Main data quality check function."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from data_processor import DataProcessor
+    
     print("🔍 WSA Retention Analysis - Data Quality Check")
     print("=" * 60)
     
@@ -103,6 +290,12 @@ def main():
         print("📊 Loading data files...")
         data = processor.load_data()
         
+        # Arrow-backed strings let the remaining .str operations run as compiled kernels
+        for df in data.values():
+            for col in STRING_COLUMNS:
+                if col in df.columns:
+                    df[col] = df[col].astype('string[pyarrow]')
+        
         print(f"✅ Loaded retention survey: {len(data['retention_survey'])} records")
         print(f"✅ Loaded 2023 registrations: {len(data['registrations_2023'])} records")
         print(f"✅ Loaded 2024 registrations: {len(data['registrations_2024'])} records")
@@ -115,7 +308,8 @@ def main():
         retention_df = data['retention_survey']
         
         print("\n📧 Email Quality:")
-        email_issues, email_domains = check_email_quality(retention_df, 'Email Address')
+        retention_domain_values = extract_domains(retention_df['Email Address'])
+        email_issues, email_domains = check_email_quality(retention_df, 'Email Address', retention_domain_values)
         if email_issues:
             for issue in email_issues:
                 print(f"   ⚠️  {issue}")
@@ -140,80 +334,18 @@ def main():
         for status, count in status_counts.items():
             print(f"   {status}: {count}")
         
-        # Check for each registration year
-        for year in [2023, 2024]:
-            reg_df = data[f'registrations_{year}']
-            
-            print(f"\n" + "="*60)
-            print(f"{year} REGISTRATIONS QUALITY CHECK")
-            print("="*60)
-            
-            print("\n📧 Email Quality:")
-            email_issues, email_domains = check_email_quality(reg_df, 'Email')
-            if email_issues:
-                for issue in email_issues:
-                    print(f"   ⚠️  {issue}")
-            else:
-                print("   ✅ No email issues found")
-            
-            print(f"\n📧 Email Domains (Top 5):")
-            for domain, count in email_domains.head().items():
-                print(f"   {domain}: {count} emails")
-            
-            print("\n👤 Name Quality:")
-            name_issues = check_name_quality(reg_df, 'Name')
-            if name_issues:
-                for issue in name_issues:
-                    print(f"   ⚠️  {issue}")
-            else:
-                print("   ✅ No name issues found")
-            
-            print(f"\n🏫 Institution Analysis:")
-            institutions, potential_dups = check_institution_consistency(reg_df, 'Institution of Study')
-            
-            print(f"   Total institutions: {len(institutions)}")
-            for inst, count in institutions.items():
-                print(f"   {inst}: {count} students")
-            
-            if potential_dups:
-                print(f"\n   ⚠️  Potential duplicate institutions:")
-                for dup1, dup2 in potential_dups:
-                    print(f"      '{dup1}' vs '{dup2}'")
-            
-            # Check province distribution and non-PEI students
-            print(f"\n📍 Province/Location Analysis:")
-            if 'Province' in reg_df.columns:
-                province_counts = reg_df['Province'].value_counts(dropna=False)
-                print(f"   Province Distribution:")
-                for province, count in province_counts.items():
-                    if pd.isna(province):
-                        print(f"      Missing/Unknown: {count}")
-                    else:
-                        print(f"      {province}: {count}")
-                
-                # Highlight non-PEI students
-                pei_variations = [
-                    'Prince Edward Island', 'Prince-Edward-Island', 'PEI', 
-                    'P.E.I.', 'Prince Edward Island, Canada', 'PE'
-                ]
-                non_pei_mask = ~reg_df['Province'].str.lower().str.strip().isin([var.lower() for var in pei_variations])
-                non_pei = reg_df[non_pei_mask]
-                
-                if len(non_pei) > 0:
-                    print(f"\n   🚨 NON-PEI STUDENTS FOUND: {len(non_pei)} students")
-                    print(f"      These will be automatically filtered out:")
-                    for province, count in non_pei['Province'].value_counts().items():
-                        print(f"         - {province}: {count} students")
-                    
-                    # Show some examples if not too many
-                    if len(non_pei) <= 10:
-                        print(f"      Example names:")
-                        for _, row in non_pei.head(5).iterrows():
-                            print(f"         - {row.get('Name', 'N/A')} ({row.get('Province', 'N/A')})")
-                else:
-                    print(f"   ✅ All students are from PEI")
-            else:
-                print(f"   ℹ️  No Province column found - filtering by institution only")
+        # Check each registration year in its own worker process, then report in order
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = {
+                year: executor.submit(check_registration_year, data[f'registrations_{year}'])
+                for year in [2023, 2024]
+            }
+            year_results = {year: future.result() for year, future in futures.items()}
+        
+        reg_domain_values = {}
+        for year, result in year_results.items():
+            reg_domain_values[year] = result['domain_values']
+            print_registration_report(year, result)
         
         # Cross-dataset analysis
         print(f"\n" + "="*60)
@@ -222,17 +354,19 @@ def main():
         
         # Email domain comparison
         print("\n📧 Email Domain Comparison:")
-        retention_domains = set(retention_df['Email Address'].str.extract(r'@(.+)')[0].dropna())
-        reg_2023_domains = set(data['registrations_2023']['Email'].str.extract(r'@(.+)')[0].dropna())
-        reg_2024_domains = set(data['registrations_2024']['Email'].str.extract(r'@(.+)')[0].dropna())
+        retention_domains = pc.unique(pa.array(retention_domain_values, type=pa.string()).drop_null())
+        reg_2023_domains = pa.array(reg_domain_values[2023], type=pa.string())
+        reg_2024_domains = pa.array(reg_domain_values[2024], type=pa.string())
+        in_2023 = pc.is_in(retention_domains, value_set=reg_2023_domains)
+        in_2024 = pc.is_in(retention_domains, value_set=reg_2024_domains)
         
-        common_domains = retention_domains & reg_2023_domains & reg_2024_domains
+        common_domains = pc.filter(retention_domains, pc.and_(in_2023, in_2024))
         print(f"   Common domains across all files: {len(common_domains)}")
         
-        unique_retention = retention_domains - reg_2023_domains - reg_2024_domains
-        if unique_retention:
+        unique_retention = pc.filter(retention_domains, pc.invert(pc.or_(in_2023, in_2024)))
+        if len(unique_retention) > 0:
             print(f"   Domains only in retention survey: {len(unique_retention)}")
-            print(f"   Examples: {list(unique_retention)[:3]}")
+            print(f"   Examples: {unique_retention[:3].to_pylist()}")
         
         # Name format comparison
         print(f"\n👤 Name Format Analysis:")
@@ -273,5 +407,14 @@ def main():
     return 0
 
 
+def parse_args(argv=None):
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Check registration and retention survey data for quality issues that hurt matching."
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
+    parse_args()
     sys.exit(main()) 
\ No newline at end of file
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Matching Regression Check for WSA Retention Analysis
+
+This script checks that the rapidfuzz-based fuzzy name matching still gives the
+results the original fuzzywuzzy matcher gave on the cases where the two libraries
+can disagree: scores just below the match threshold that round up to it, and
+names with accented (Latin-1) letters, which fuzzywuzzy dropped before scoring.
+"""
+
+import sys
+
+# Add src to path
+sys.path.append('src')
+
+# (registration name, survey names, expected matched survey name or None, expected confidence),
+# with the expectations recorded from fuzzywuzzy 0.18's WRatio
+MATCH_CASES = [
+    # Scores 84.6, which fuzzywuzzy rounded to 85 and accepted
+    ('Michael Brown', ['Mikhaek Brown', 'Sara Lee'], 'mikhaek brown', 85),
+    # 'ä' is dropped before scoring, so this is 'john rne singh' against each name
+    ('John Ärne Singh', ['John Patel', 'John Singh'], 'john singh', 95),
+    ('Renée Gagné', ['Renee Gagne', 'Wei Chen'], 'renee gagne', 90),
+    ('Zoë Smith', ['Zoe Smith', 'Kwame Okafor'], 'zoe smith', 94),
+    # Below the threshold however it is rounded
+    ('Wei Chen', ['Sara Lee', 'Kwame Okafor'], None, 0),
+]
+
+# (name, candidate names, threshold, expected find_name_matches result), recorded the same way
+FIND_CASES = [
+    # 'mikhaek brown' scores 84.6 and is returned as 85
+    ('michael brown', ['mikhaek brown', 'sara lee', 'michael browne'], 85,
+     [('michael browne', 96), ('mikhaek brown', 85)]),
+    ('renée gagné', ['renee gagne', 'rene gagnon', 'wei chen'], 80,
+     [('renee gagne', 90), ('rene gagnon', 90)]),
+]
+
+
+def check_match_members():
+    """Run match_members on each case and return the descriptions of the cases that differ."""
+    import pandas as pd
+    from data_processor import DataProcessor
+
+    failures = []
+    for name, survey_names, expected_name, expected_confidence in MATCH_CASES:
+        processor = DataProcessor(cache_dir=None)
+        processor.retention_survey = pd.DataFrame({
+            'Name': survey_names,
+            'Email Address': [''] * len(survey_names),
+            'Status': [f"status {row}" for row in range(len(survey_names))]
+        })
+        processor.registrations_2023 = pd.DataFrame({
+            'Name': [name], 'Email': [''], 'Province': ['PEI'], 'Date of Enrollment': ['2023-01-01']
+        })
+        processor.registrations_2024 = processor.registrations_2023.iloc[:0].copy()
+        processor.preprocess_data()
+
+        result = processor.match_members(2023).iloc[0]
+        survey_clean = processor.retention_survey['name_clean'].tolist()
+        expected_status = ('Unknown' if expected_name is None
+                           else f"status {survey_clean.index(expected_name)}")
+        if (result['retention_status'], result['match_confidence']) != (expected_status, expected_confidence):
+            failures.append(f"{name!r}: expected {expected_name!r} at {expected_confidence}, "
+                            f"got {result['retention_status']!r} at {result['match_confidence']}")
+    return failures
+
+
+def check_find_name_matches():
+    """Run find_name_matches on each case and return the descriptions of the cases that differ."""
+    from data_processor import DataProcessor
+
+    processor = DataProcessor(cache_dir=None)
+    failures = []
+    for name, candidates, threshold, expected in FIND_CASES:
+        result = processor.find_name_matches(name, candidates, threshold)
+        if result != expected:
+            failures.append(f"{name!r}: expected {expected}, got {result}")
+    return failures
+
+
+def main():
+    """Run the fuzzy matching regression checks."""
+    print("🔍 Checking fuzzy name matching against the original matcher...")
+    failures = check_match_members() + check_find_name_matches()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+
+    print(f"✅ All {len(MATCH_CASES)} match_members and {len(FIND_CASES)} find_name_matches cases agree")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,25 +9,125 @@ the repository public. It checks for potential data exposure issues.
 import os
 import subprocess
 import sys
-from pathlib import Path
+from functools import lru_cache
 import re
 
+# Sensitive file patterns (re.search already scans the whole path, so no leading/trailing .*)
+SENSITIVE_PATTERNS = [
+    r'\.csv$',
+    r'reports/.*\.json$',
+    r'data/raw/',
+    r'Backend-20\d{2}'
+]
 
-def run_command(cmd):
-    """Run a command and return the output."""
+# Sensitive plain substrings, checked against the lowercased path without regex
+SENSITIVE_SUBSTRINGS = (b"members summary",)
+
+# Safe patterns that are allowed (sample data with fictional content)
+SAFE_PATTERNS = [
+    r'data/sample/.*\.csv$',
+    r'reports/demo_.*\.json$'
+]
+
+# Files the repository is expected to ship (sample data is fictional)
+SAMPLE_DATA_FILES = (
+    "data/sample/sample_retention_survey.csv",
+    "data/sample/sample_registrations_2023.csv",
+    "data/sample/sample_registrations_2024.csv"
+)
+
+REQUIRED_DOCS = (
+    "DATA_SECURITY.md",
+    "README.md",
+    "QUICK_START.md"
+)
+
+# Real data files that may exist locally but must never be tracked
+REAL_DATA_FILES = (
+    "data/raw/Are they still in PEI? - Members Summary.csv",
+    "data/raw/Website Memberships-Backend-2023.csv",
+    "data/raw/Website Memberships-Backend-2024.csv"
+)
+
+# Pathspecs handed to `git ls-files` so git filters the index in C and Python only sees
+# candidates. Must stay a (case-insensitive) superset of SENSITIVE_PATTERNS and
+# SENSITIVE_SUBSTRINGS; the regexes below still decide what is actually flagged.
+TRACKED_PATHSPECS = [
+    ':(icase)*.csv',
+    ':(icase)*reports/*.json',
+    ':(icase)*data/raw/*',
+    ':(icase)*backend-20*',
+    ':(icase)*members summary*'
+]
+
+# Each pattern list fused into one alternation so a file is tested with a single search.
+# Compiled as bytes patterns because tracked paths are read from `git ls-files -z` undecoded.
+# The search already runs in re's C engine; handing paths to `git check-ignore --stdin`
+# instead would cost another process and turn these regexes into approximate gitignore globs.
+SENSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in SENSITIVE_PATTERNS).encode(), re.IGNORECASE)
+SAFE_RE = re.compile("|".join(f"(?:{p})" for p in SAFE_PATTERNS).encode(), re.IGNORECASE)
+
+
+def run_command(argv, text=True):
+    """Run a command (given as an argument list, without a shell) and return the output.
+    
+    With text=False stdout/stderr are returned as undecoded bytes.
+    """
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(argv, capture_output=True, text=text, check=False)
         return result.returncode, result.stdout, result.stderr
     except Exception as e:
-        return -1, "", str(e)
+        return -1, "" if text else b"", str(e) if text else str(e).encode()
+
+
+@lru_cache(maxsize=None)
+def _git_tracked_files():
+    """
+    List tracked candidate paths once per run; shared by the checks that need the index.
+    
+    Returns:
+        (returncode, tuple of raw bytes paths, stderr bytes)
+    """
+    # NUL-separated, unquoted raw paths
+    argv = ["git", "ls-files", "-z", "--exclude-standard", "--", *TRACKED_PATHSPECS]
+    code, stdout, stderr = run_command(argv, text=False)
+    paths = tuple(path for path in stdout.split(b"\0") if path) if code == 0 else ()
+    return code, paths, stderr
+
+
+def _existing_names(directory):
+    """Return the entry names of a directory with a single scandir (empty if it is missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _existing_files(paths):
+    """Return the subset of paths that exist, listing each parent directory only once.
+    
+    Only worth it for several files in a shared directory; a check for a single
+    file should stay a plain os.path.exists() (one stat beats listing a directory).
+    """
+    listings = {}
+    found = set()
+    for path in paths:
+        parent, name = os.path.split(path)
+        if parent not in listings:
+            listings[parent] = _existing_names(parent or ".")
+        if name in listings[parent]:
+            found.add(path)
+    return found
 
 
 def check_gitignore_exists():
     """Check if .gitignore file exists and contains essential rules."""
     print("🔍 Checking .gitignore file...")
     
-    gitignore_path = Path(".gitignore")
-    if not gitignore_path.exists():
+    # Single file: a direct stat is cheaper than listing the directory
+    gitignore_path = ".gitignore"
+    if not os.path.exists(gitignore_path):
         print("❌ .gitignore file not found!")
         return False
     
@@ -41,10 +141,13 @@ def check_gitignore_exists():
         ".venv"
     ]
     
-    missing_rules = []
-    for rule in essential_rules:
-        if rule not in content:
-            missing_rules.append(rule)
+    # One pass over the file; leading/trailing slashes don't change which rule a line is
+    rules = {
+        line.strip().strip('/')
+        for line in content.splitlines()
+        if line.strip() and not line.lstrip().startswith('#')
+    }
+    missing_rules = [rule for rule in essential_rules if rule not in rules]
     
     if missing_rules:
         print(f"❌ Missing essential .gitignore rules: {missing_rules}")
@@ -59,44 +162,27 @@ def check_git_tracked_files():
     print("\n🔍 Checking for tracked sensitive files...")
     
     # Check what files git would include
-    code, stdout, stderr = run_command("git ls-files --exclude-standard")
+    code, tracked_files, stderr = _git_tracked_files()
     
     if code != 0:
-        print(f"❌ Error running git command: {stderr}")
+        print(f"❌ Error running git command: {stderr.decode(errors='replace')}")
         return False
     
-    tracked_files = stdout.strip().split('\n') if stdout.strip() else []
-    
-    # Check for sensitive file patterns
-    sensitive_patterns = [
-        r'\.csv$',
-        r'reports/.*\.json$',
-        r'data/raw/.*',
-        r'.*Members Summary.*',
-        r'.*Backend-20\d{2}.*'
-    ]
-    
-    # Safe patterns that are allowed (sample data with fictional content)
-    safe_patterns = [
-        r'data/sample/.*\.csv$',
-        r'reports/demo_.*\.json$'
-    ]
+    # Nothing matched the pathspecs, so there is nothing for the regexes to check
+    if not tracked_files:
+        print("✅ No sensitive files are being tracked")
+        return True
     
     sensitive_tracked = []
     for file in tracked_files:
-        # Check if file matches any safe pattern first
-        is_safe = False
-        for safe_pattern in safe_patterns:
-            if re.search(safe_pattern, file, re.IGNORECASE):
-                is_safe = True
-                break
+        # Files matching a safe pattern are allowed even if they look sensitive
+        if SAFE_RE.search(file):
+            continue
         
-        if not is_safe:
-            # Check if file matches sensitive patterns
-            for pattern in sensitive_patterns:
-                if re.search(pattern, file, re.IGNORECASE):
-                    sensitive_tracked.append(file)
-                    break
+        lowered = file.lower()
+        if any(sub in lowered for sub in SENSITIVE_SUBSTRINGS) or SENSITIVE_RE.search(file):
+            # Only paths that are reported get decoded
+            sensitive_tracked.append(file.decode(errors='replace'))
     
     if sensitive_tracked:
         print("❌ Sensitive files are being tracked:")
@@ -112,16 +198,8 @@ def check_sample_data():
     """Check if sample data files exist."""
     print("\n🔍 Checking sample data availability...")
     
-    sample_files = [
-        "data/sample/sample_retention_survey.csv",
-        "data/sample/sample_registrations_2023.csv", 
-        "data/sample/sample_registrations_2024.csv"
-    ]
-    
-    missing_samples = []
-    for file in sample_files:
-        if not Path(file).exists():
-            missing_samples.append(file)
+    existing = _existing_files(SAMPLE_DATA_FILES)
+    missing_samples = [file for file in SAMPLE_DATA_FILES if file not in existing]
     
     if missing_samples:
         print("❌ Missing sample data files:")
@@ -137,16 +215,8 @@ def check_documentation():
     """Check if security documentation exists."""
     print("\n🔍 Checking security documentation...")
     
-    required_docs = [
-        "DATA_SECURITY.md",
-        "README.md",
-        "QUICK_START.md"
-    ]
-    
-    missing_docs = []
-    for doc in required_docs:
-        if not Path(doc).exists():
-            missing_docs.append(doc)
+    existing = _existing_files(REQUIRED_DOCS)
+    missing_docs = [doc for doc in REQUIRED_DOCS if doc not in existing]
     
     if missing_docs:
         print("❌ Missing documentation files:")
@@ -155,7 +225,8 @@ def check_documentation():
         return False
     
     # Check if DATA_SECURITY.md mentions key security topics
-    with open("DATA_SECURITY.md", 'r') as f:
+    # Topics are ASCII, so the raw bytes can be lowercased and searched without decoding
+    with open("DATA_SECURITY.md", 'rb') as f:
         content = f.read().lower()
     
     security_topics = [
@@ -165,10 +236,7 @@ def check_documentation():
         "protect"
     ]
     
-    missing_topics = []
-    for topic in security_topics:
-        if topic not in content:
-            missing_topics.append(topic)
+    missing_topics = [topic for topic in security_topics if topic.encode() not in content]
     
     if missing_topics:
         print(f"⚠️  DATA_SECURITY.md may be missing key topics: {missing_topics}")
@@ -181,7 +249,8 @@ def check_demo_script():
     """Check if demo script exists and works."""
     print("\n🔍 Checking demo script...")
     
-    if not Path("run_demo.py").exists():
+    # Single file: a direct stat is cheaper than listing the directory
+    if not os.path.exists("run_demo.py"):
         print("❌ Demo script (run_demo.py) not found")
         return False
     
@@ -193,23 +262,16 @@ def check_real_data_exists():
     """Check if real data files exist (they should, but not be tracked)."""
     print("\n🔍 Checking for real data files...")
     
-    real_data_files = [
-        "data/raw/Are they still in PEI? - Members Summary.csv",
-        "data/raw/Website Memberships-Backend-2023.csv",
-        "data/raw/Website Memberships-Backend-2024.csv"
-    ]
-    
-    exists_count = 0
-    for file in real_data_files:
-        if Path(file).exists():
-            exists_count += 1
+    # All three files share data/raw, so this is a single directory read rather
+    # than one stat per file; no async/batched stat machinery is needed on top.
+    exists_count = len(_existing_files(REAL_DATA_FILES))
     
     if exists_count > 0:
         print(f"ℹ️  Found {exists_count} real data files (this is OK if they're ignored by git)")
         
-        # Double-check they're not tracked
-        code, stdout, stderr = run_command("git ls-files data/raw/")
-        if stdout.strip():
+        # Double-check they're not tracked (reuses the tracked-file listing)
+        code, tracked_files, stderr = _git_tracked_files()
+        if any(file.startswith(b"data/raw/") for file in tracked_files):
             print("❌ Real data files are being tracked by git!")
             return False
         else:
@@ -7,13 +7,14 @@ generates reports, and saves the results.
 """
 
 import sys
-import json
+import heapq
 from pathlib import Path
 
 # Add src to path so we can import our modules
 sys.path.append('src')
 
 from retention_analyzer import RetentionAnalyzer
+from report_writer import save_json_report
 
 
 def main():
@@ -27,18 +28,18 @@ def main():
         # Initialize the analyzer
         analyzer = RetentionAnalyzer()
         
-        # Run analysis for 2023
-        print("\nAnalyzing 2023 data...")
-        results_2023 = analyzer.analyze_retention(year=2023)
+        # Both years are analyzed in parallel threads
+        analyzer.load_and_preprocess_data()
+        print("\nAnalyzing 2023 and 2024 data...")
+        results = analyzer.analyze_years((2023, 2024))
+        results_2023, results_2024 = results[2023], results[2024]
+        
         analyzer.print_summary(results_2023, year=2023)
         
         # Save 2023 results
         file_2023 = analyzer.save_results(results_2023, "retention_analysis_2023.json")
         print(f"\n2023 Results saved to: {file_2023}")
         
-        # Run analysis for 2024
-        print("\nAnalyzing 2024 data...")
-        results_2024 = analyzer.analyze_retention(year=2024)
         analyzer.print_summary(results_2024, year=2024)
         
         # Save 2024 results
@@ -50,9 +51,7 @@ def main():
         comparison = analyzer.compare_years(results_2023, results_2024)
         
         # Save comparison
-        comparison_file = Path("reports") / "year_comparison.json"
-        with open(comparison_file, 'w') as f:
-            json.dump(comparison, f, indent=2, default=str)
+        comparison_file = save_json_report(comparison, Path("reports") / "year_comparison.json")
         
         print(f"Comparison saved to: {comparison_file}")
         
@@ -69,9 +68,9 @@ def main():
         # Top retention rates by institution
         print(f"\nHighest Retention Rates (2024):")
         inst_data = results_2024['institution_breakdown']
-        sorted_institutions = sorted(inst_data.items(), key=lambda x: x[1]['retention_rate'], reverse=True)
+        top_institutions = heapq.nlargest(3, inst_data.items(), key=lambda x: x[1]['retention_rate'])
         
-        for i, (institution, data) in enumerate(sorted_institutions[:3]):
+        for i, (institution, data) in enumerate(top_institutions):
             if data['matched_members'] >= 5:  # Only show institutions with meaningful sample size
                 print(f"  {i+1}. {institution}: {data['retention_rate']:.1f}%")
         
@@ -5,68 +5,28 @@ Demo Script for WSA Retention Analysis
 This script demonstrates the retention analysis functionality using
 SAMPLE DATA ONLY - no real personal information is used.
 
-This is safe to run and demonstrates all features of the system.
+This is safe to run and demonstrates all features of the system. The sample
+files are read in place from data/sample, so nothing is written to data/raw
+and there is nothing to clean up afterwards, even if the demo is interrupted.
 """
 
 import sys
-import json
 from pathlib import Path
 
 # Add src to path so we can import our modules
 sys.path.append('src')
 
 from retention_analyzer import RetentionAnalyzer
+from report_writer import save_json_report
 
 
-def setup_demo_environment():
-    """
-    Set up the demo environment with sample data.
-    """
-    print("Setting up demo environment with sample data...")
-    
-    # Create necessary directories
-    Path("data/raw").mkdir(parents=True, exist_ok=True)
-    Path("reports").mkdir(exist_ok=True)
-    
-    # Copy sample files to the expected locations for demo
-    import shutil
-    
-    sample_files = [
-        ("data/sample/sample_retention_survey.csv", "data/raw/Are they still in PEI? - Members Summary.csv"),
-        ("data/sample/sample_registrations_2023.csv", "data/raw/Website Memberships-Backend-2023.csv"),
-        ("data/sample/sample_registrations_2024.csv", "data/raw/Website Memberships-Backend-2024.csv")
-    ]
-    
-    for source, dest in sample_files:
-        if Path(source).exists():
-            shutil.copy2(source, dest)
-            print(f"✅ Copied {source} → {dest}")
-        else:
-            print(f"❌ Sample file not found: {source}")
-    
-    print("Demo environment ready!\n")
-
-
-def cleanup_demo_environment():
-    """
-    Clean up demo files after the demonstration.
-    """
-    print("\nCleaning up demo environment...")
-    
-    demo_files = [
-        "data/raw/Are they still in PEI? - Members Summary.csv",
-        "data/raw/Website Memberships-Backend-2023.csv", 
-        "data/raw/Website Memberships-Backend-2024.csv"
-    ]
-    
-    for file_path in demo_files:
-        try:
-            Path(file_path).unlink()
-            print(f"🗑️ Removed {file_path}")
-        except FileNotFoundError:
-            pass
-    
-    print("Demo cleanup complete!")
+# Sample files read in place of the real data files, keyed like DataProcessor's RAW_DATA_FILES
+SAMPLE_DATA_DIR = "data/sample"
+SAMPLE_DATA_FILES = {
+    'retention_survey': "sample_retention_survey.csv",
+    'registrations_2023': "sample_registrations_2023.csv",
+    'registrations_2024': "sample_registrations_2024.csv"
+}
 
 
 def main():
@@ -80,24 +40,21 @@ def main():
     print("=" * 60)
     
     try:
-        # Set up demo environment
-        setup_demo_environment()
+        # Initialize the analyzer on the sample files directly; nothing is copied into data/raw
+        analyzer = RetentionAnalyzer(data_dir=SAMPLE_DATA_DIR, data_files=SAMPLE_DATA_FILES)
         
-        # Initialize the analyzer
-        analyzer = RetentionAnalyzer()
+        # Both years are analyzed in parallel threads
+        analyzer.load_and_preprocess_data()
+        print("\n📊 Analyzing 2023 and 2024 sample data...")
+        results = analyzer.analyze_years((2023, 2024))
+        results_2023, results_2024 = results[2023], results[2024]
         
-        # Run analysis for 2023
-        print("\n📊 Analyzing 2023 sample data...")
-        results_2023 = analyzer.analyze_retention(year=2023)
         analyzer.print_summary(results_2023, year=2023)
         
         # Save 2023 results
         file_2023 = analyzer.save_results(results_2023, "demo_retention_analysis_2023.json")
         print(f"\n💾 2023 Demo Results saved to: {file_2023}")
         
-        # Run analysis for 2024
-        print("\n📊 Analyzing 2024 sample data...")
-        results_2024 = analyzer.analyze_retention(year=2024)
         analyzer.print_summary(results_2024, year=2024)
         
         # Save 2024 results
@@ -109,9 +66,7 @@ def main():
         comparison = analyzer.compare_years(results_2023, results_2024)
         
         # Save comparison
-        comparison_file = Path("reports") / "demo_year_comparison.json"
-        with open(comparison_file, 'w') as f:
-            json.dump(comparison, f, indent=2, default=str)
+        comparison_file = save_json_report(comparison, Path("reports") / "demo_year_comparison.json")
         
         print(f"📊 Comparison saved to: {comparison_file}")
         
@@ -141,12 +96,8 @@ def main():
         print("📁 Check the 'reports' directory for demo JSON files")
         print("📖 Read DATA_SECURITY.md for data protection guidelines")
         
-        # Clean up demo files
-        cleanup_demo_environment()
-        
     except Exception as e:
         print(f"❌ Error during demo: {e}")
-        cleanup_demo_environment()
         sys.exit(1)
 
 
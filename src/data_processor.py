@@ -8,32 +8,220 @@ for the retention analysis.
 import pandas as pd
 import numpy as np
 import re
+import hashlib
 from typing import Dict, List, Tuple, Optional
 from pathlib import Path
 import logging
-from fuzzywuzzy import fuzz, process
+import pyarrow as pa
+import pyarrow.compute as pc
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump whenever loading/cleaning logic changes so stale disk caches are ignored
+PREPROCESS_VERSION = 3
+
+# Minimum WRatio score for a fuzzy name match to count
+FUZZY_MATCH_THRESHOLD = 85
+
+# fuzzywuzzy's WRatio, which the thresholds were tuned on, dropped the Latin-1 range
+# (accented letters such as 'ä' or 'é') before scoring; rapidfuzz would keep them
+LATIN1_DROP = str.maketrans('', '', ''.join(map(chr, range(128, 256))))
+
+# Patterns used by clean_names / clean_emails, compiled once
+WHITESPACE_RE = re.compile(r'\s+')
+NAME_TITLE_RE = re.compile(r'\b(mr\.?|mrs\.?|ms\.?|dr\.?)\b')
+NAME_SPECIAL_RE = re.compile(r'[^\w\s\-]')
+EMAIL_SEPARATOR_RE = re.compile(r'[,;\s]+')
+
+# Arrow (RE2) versions of the cleaning patterns for the column-wise cleaners. RE2's
+# \w, \b and \s are ASCII-only, so these are only applied to pure-ASCII values, with
+# \s spelled out as the ASCII characters Python treats as whitespace.
+ASCII_WHITESPACE = "\t\n\v\f\r\x1c\x1d\x1e\x1f "
+_ARROW_SPACE = r'\t\n\v\f\r\x1c-\x1f '
+ARROW_WHITESPACE_PATTERN = rf'[{_ARROW_SPACE}]+'
+ARROW_NAME_SPECIAL_PATTERN = rf'[^\w{_ARROW_SPACE}\-]'
+# First separator-delimited token whose part after the last '@' contains a '.'
+ARROW_EMAIL_PATTERN = (rf'(?:^|[,;{_ARROW_SPACE}])'
+                       rf'(?P<email>[^,;{_ARROW_SPACE}]*@[^,;{_ARROW_SPACE}@]*\.[^,;{_ARROW_SPACE}@]*)'
+                       rf'(?:[,;{_ARROW_SPACE}]|$)')
+
+# Lowercased Prince Edward Island spellings accepted by filter_pei_students
+PEI_PROVINCE_NAMES = frozenset(name.lower() for name in [
+    'Prince Edward Island',
+    'Prince-Edward-Island',
+    'PEI',
+    'P.E.I.',
+    'Prince Edward Island, Canada',
+    'PE'
+])
+
+# Lowercased PEI institutions, used when a file has no Province column
+PEI_INSTITUTION_NAMES = frozenset(name.lower() for name in [
+    'UPEI',
+    'University of Prince Edward Island',
+    'Holland College',
+    'Collège de l\'Île',
+    'College de l\'Ile',
+    'Collège de l\'île',
+    'Maritime Christian College',
+    'PEI Paramedic Academy',
+    'Prince Edward Island University',
+    'l\'Île College'
+])
+
+# Raw CSV file names expected in the data directory
+RAW_DATA_FILES = {
+    'retention_survey': "Are they still in PEI? - Members Summary.csv",
+    'registrations_2023': "Website Memberships-Backend-2023.csv",
+    'registrations_2024': "Website Memberships-Backend-2024.csv"
+}
+
+# read_csv options for the raw files. The Arrow reader parses in parallel; the date
+# column is given an explicit str dtype so the dates Arrow infers come back as text,
+# as the C parser left them, until preprocess_data parses them.
+READ_CSV_OPTIONS = {
+    'engine': 'pyarrow',
+    'dtype': {'Date of Enrollment': str}
+}
+
+
+def fuzzy_process(name: str) -> str:
+    """Prepare a name for WRatio the way fuzzywuzzy did: drop Latin-1 letters, then lowercase and strip symbols."""
+    return default_process(name.translate(LATIN1_DROP))
+
 
 class DataProcessor:
     """
     Class to handle data loading, cleaning, and preprocessing for retention analysis.
     """
     
-    def __init__(self, data_dir: str = "data/raw"):
+    def __init__(self, data_dir: str = "data/raw", cache_dir: Optional[str] = "data/cache",
+                 data_files: Optional[Dict[str, str]] = None):
         """
         Initialize the DataProcessor.
         
         Args:
             data_dir (str): Directory containing the raw CSV files
+            cache_dir (str, optional): Directory for cached DataFrames (None disables caching)
+            data_files (Dict[str, str], optional): File names overriding RAW_DATA_FILES,
+                keyed by dataset name (e.g. to read the sample data in place)
         """
         self.data_dir = Path(data_dir)
+        self.data_files = {**RAW_DATA_FILES, **(data_files or {})}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.retention_survey = None
         self.registrations_2023 = None
         self.registrations_2024 = None
+        # match_members results per year with the registrations and survey frames they were
+        # matched from; cleared whenever the datasets are reloaded
+        self._match_cache: Dict[int, Tuple[Tuple, pd.DataFrame]] = {}
+        # _get_survey_index lookups and the survey frame they were built from
+        self._survey_index: Optional[Dict] = None
+        self._survey_index_source: Optional[pd.DataFrame] = None
+    
+    def _cache_key(self) -> Optional[Tuple[str, str]]:
+        """
+        Build cache keys from the raw CSV files and the preprocessing version.
+        
+        Returns:
+            Optional[Tuple[str, str]]: Hex digests of the data source (data directory and file
+            names) and of its state (CSV modification times and sizes plus the preprocessing
+            version), or None if caching is disabled or a file is missing
+        """
+        if self.cache_dir is None:
+            return None
+        
+        source = [str(self.data_dir.resolve())]
+        state = [f"v{PREPROCESS_VERSION}"]
+        try:
+            for filename in self.data_files.values():
+                stat = (self.data_dir / filename).stat()
+                source.append(filename)
+                state.append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        except OSError:
+            return None
+        
+        return tuple(hashlib.md5("|".join(parts).encode('utf-8')).hexdigest()[:16]
+                     for parts in (source, state))
+    
+    def _cache_files(self, stage: str, key: Tuple[str, str]) -> Dict[str, Path]:
+        """
+        Cache file paths for a processing stage, one Parquet file per dataset.
+        
+        Args:
+            stage (str): Processing stage name
+            key (Tuple[str, str]): Source and state digests from _cache_key
+            
+        Returns:
+            Dict[str, Path]: Paths keyed by dataset name
+        """
+        source, state = key
+        return {name: self.cache_dir / f"{stage}_{source}_{state}_{name}.parquet"
+                for name in self.data_files}
+    
+    def _read_cache(self, stage: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """
+        Read cached DataFrames for a processing stage ('raw' or 'processed').
+        
+        Args:
+            stage (str): Processing stage name
+            
+        Returns:
+            Optional[Dict[str, pd.DataFrame]]: Cached datasets, or None on a cache miss
+        """
+        key = self._cache_key()
+        if key is None:
+            return None
+        
+        cache_files = self._cache_files(stage, key)
+        if not all(path.exists() for path in cache_files.values()):
+            return None
+        
+        try:
+            frames = {name: pd.read_parquet(path) for name, path in cache_files.items()}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {stage} data cache: {e}")
+            return None
+        
+        logger.info(f"Loaded {stage} data from cache: {self.cache_dir}")
+        return frames
+    
+    def _write_cache(self, stage: str, frames: Dict[str, pd.DataFrame]) -> None:
+        """
+        Write DataFrames for a processing stage to the disk cache.
+        
+        Older entries for the same data directory and files are replaced; caches for
+        other data sources (e.g. the sample data) are kept.
+        
+        Args:
+            stage (str): Processing stage name
+            frames (Dict[str, pd.DataFrame]): Datasets to cache
+        """
+        key = self._cache_key()
+        if key is None:
+            return
+        
+        cache_files = self._cache_files(stage, key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            current_files = set(cache_files.values())
+            for stale_file in self.cache_dir.glob(f"{stage}_{key[0]}_*.parquet"):
+                if stale_file not in current_files:
+                    stale_file.unlink()
+            for name, path in cache_files.items():
+                frames[name].to_parquet(path)
+        except Exception as e:
+            logger.warning(f"Could not write {stage} data cache: {e}")
+    
+    def _set_datasets(self, frames: Dict[str, pd.DataFrame]) -> None:
+        """Assign cached datasets back onto the processor."""
+        self.retention_survey = frames['retention_survey']
+        self.registrations_2023 = frames['registrations_2023']
+        self.registrations_2024 = frames['registrations_2024']
         
     def load_data(self) -> Dict[str, pd.DataFrame]:
         """
@@ -43,28 +231,37 @@ class DataProcessor:
             Dict[str, pd.DataFrame]: Dictionary containing all loaded datasets
         """
         logger.info("Loading data files...")
+        self._match_cache.clear()
+        self._survey_index = None
+        
+        cached = self._read_cache('raw')
+        if cached is not None:
+            self._set_datasets(cached)
+            return cached
         
         try:
             # Load retention survey data
-            retention_file = self.data_dir / "Are they still in PEI? - Members Summary.csv"
-            self.retention_survey = pd.read_csv(retention_file)
+            retention_file = self.data_dir / self.data_files['retention_survey']
+            self.retention_survey = pd.read_csv(retention_file, **READ_CSV_OPTIONS)
             logger.info(f"Loaded retention survey: {len(self.retention_survey)} records")
             
             # Load 2023 registrations
-            reg_2023_file = self.data_dir / "Website Memberships-Backend-2023.csv"
-            self.registrations_2023 = pd.read_csv(reg_2023_file)
+            reg_2023_file = self.data_dir / self.data_files['registrations_2023']
+            self.registrations_2023 = pd.read_csv(reg_2023_file, **READ_CSV_OPTIONS)
             logger.info(f"Loaded 2023 registrations: {len(self.registrations_2023)} records")
             
             # Load 2024 registrations
-            reg_2024_file = self.data_dir / "Website Memberships-Backend-2024.csv"
-            self.registrations_2024 = pd.read_csv(reg_2024_file)
+            reg_2024_file = self.data_dir / self.data_files['registrations_2024']
+            self.registrations_2024 = pd.read_csv(reg_2024_file, **READ_CSV_OPTIONS)
             logger.info(f"Loaded 2024 registrations: {len(self.registrations_2024)} records")
             
-            return {
+            frames = {
                 'retention_survey': self.retention_survey,
                 'registrations_2023': self.registrations_2023,
                 'registrations_2024': self.registrations_2024
             }
+            self._write_cache('raw', frames)
+            return frames
             
         except FileNotFoundError as e:
             logger.error(f"File not found: {e}")
@@ -90,13 +287,13 @@ class DataProcessor:
         name = str(name).lower().strip()
         
         # Remove extra spaces
-        name = re.sub(r'\s+', ' ', name)
+        name = WHITESPACE_RE.sub(' ', name)
         
         # Remove common suffixes/prefixes
-        name = re.sub(r'\b(mr\.?|mrs\.?|ms\.?|dr\.?)\b', '', name)
+        name = NAME_TITLE_RE.sub('', name)
         
         # Remove special characters but keep spaces and hyphens
-        name = re.sub(r'[^\w\s\-]', '', name)
+        name = NAME_SPECIAL_RE.sub('', name)
         
         return name.strip()
     
@@ -116,7 +313,7 @@ class DataProcessor:
         email = str(email).lower().strip()
         
         # Handle multiple emails separated by commas, semicolons, or spaces
-        emails = re.split(r'[,;\s]+', email)
+        emails = EMAIL_SEPARATOR_RE.split(email)
         
         # Return the first valid email
         for e in emails:
@@ -126,6 +323,91 @@ class DataProcessor:
         
         return email
     
+    def _clean_column(self, values: pd.Series, ascii_cleaner, scalar_cleaner) -> pd.Series:
+        """
+        Clean a whole column with Arrow string kernels, falling back per value where needed.
+        
+        Args:
+            values (pd.Series): Raw column
+            ascii_cleaner: Function mapping a pyarrow string array to its cleaned array;
+                only its results for pure-ASCII values are used
+            scalar_cleaner: Row-wise cleaner used for the remaining (non-ASCII) values
+            
+        Returns:
+            pd.Series: Cleaned strings, identical to values.apply(scalar_cleaner), with pandas'
+            default string dtype (Arrow-backed str on pandas 3, object before)
+        """
+        text = pa.array(values.fillna('').astype(str), type=pa.string())
+        if isinstance(text, pa.ChunkedArray):
+            # Arrow-backed columns can arrive in many small chunks; kernels run per chunk
+            text = text.combine_chunks()
+        cleaned = ascii_cleaner(text).to_numpy(zero_copy_only=False)
+        
+        # Missing and non-string values are ASCII once converted, so only real strings fall back
+        non_ascii = np.flatnonzero(~pc.string_is_ascii(text).to_numpy(zero_copy_only=False))
+        if len(non_ascii):
+            cleaned[non_ascii] = [scalar_cleaner(value) for value in text.take(non_ascii).to_pylist()]
+        
+        return pd.Series(cleaned, index=values.index).astype(str)
+    
+    def _clean_names_ascii(self, names: pa.Array) -> pa.Array:
+        """Arrow equivalent of clean_names for pure-ASCII values."""
+        names = pc.utf8_trim(pc.ascii_lower(names), ASCII_WHITESPACE)
+        names = pc.replace_substring_regex(names, ARROW_WHITESPACE_PATTERN, ' ')
+        names = pc.replace_substring_regex(names, NAME_TITLE_RE.pattern, '')
+        names = pc.replace_substring_regex(names, ARROW_NAME_SPECIAL_PATTERN, '')
+        return pc.utf8_trim(names, ASCII_WHITESPACE)
+    
+    def _clean_emails_ascii(self, emails: pa.Array) -> pa.Array:
+        """Arrow equivalent of clean_emails for pure-ASCII values."""
+        emails = pc.utf8_trim(pc.ascii_lower(emails), ASCII_WHITESPACE)
+        first_valid = pc.struct_field(pc.extract_regex(emails, ARROW_EMAIL_PATTERN), [0])
+        return pc.coalesce(first_valid, emails)
+    
+    def clean_names_series(self, names: pd.Series) -> pd.Series:
+        """
+        Column-wise clean_names.
+        
+        Args:
+            names (pd.Series): Raw names
+            
+        Returns:
+            pd.Series: Cleaned names
+        """
+        return self._clean_column(names, self._clean_names_ascii, self.clean_names)
+    
+    def clean_emails_series(self, emails: pd.Series) -> pd.Series:
+        """
+        Column-wise clean_emails.
+        
+        Args:
+            emails (pd.Series): Raw email strings
+            
+        Returns:
+            pd.Series: Cleaned emails
+        """
+        return self._clean_column(emails, self._clean_emails_ascii, self.clean_emails)
+    
+    def _normalized_isin(self, values: pd.Series, allowed: frozenset) -> pd.Series:
+        """
+        values.str.lower().str.strip().isin(allowed), normalizing each distinct value once.
+        
+        The column is encoded as a categorical so the lowercase/strip work runs over its
+        (few) categories; rows are then selected through the integer category codes.
+        
+        Args:
+            values (pd.Series): Low-cardinality string column
+            allowed (frozenset): Accepted lowercase values
+            
+        Returns:
+            pd.Series: Boolean mask aligned with values (missing values are False)
+        """
+        categorical = values.astype('category')
+        allowed_categories = categorical.cat.categories.str.lower().str.strip().isin(allowed)
+        # Code -1 (missing) picks the trailing False
+        lookup = np.append(allowed_categories, False)
+        return pd.Series(lookup[categorical.cat.codes.to_numpy()], index=values.index)
+    
     def filter_pei_students(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filter registrations to include only students from PEI institutions/province.
@@ -141,18 +423,8 @@ class DataProcessor:
         
         # Check if Province column exists
         if 'Province' in df.columns:
-            # Filter for Prince Edward Island variations
-            pei_variations = [
-                'Prince Edward Island',
-                'Prince-Edward-Island', 
-                'PEI',
-                'P.E.I.',
-                'Prince Edward Island, Canada',
-                'PE'
-            ]
-            
             # Create case-insensitive filter
-            pei_mask = df['Province'].str.lower().str.strip().isin([var.lower() for var in pei_variations])
+            pei_mask = self._normalized_isin(df['Province'], PEI_PROVINCE_NAMES)
             original_count = len(df)
             df_filtered = df[pei_mask].copy()
             filtered_count = len(df_filtered)
@@ -162,21 +434,8 @@ class DataProcessor:
         
         # If no Province column, check Institution of Study for PEI institutions
         elif 'Institution of Study' in df.columns:
-            pei_institutions = [
-                'UPEI',
-                'University of Prince Edward Island',
-                'Holland College',
-                'Collège de l\'Île',
-                'College de l\'Ile',
-                'Collège de l\'île',
-                'Maritime Christian College',
-                'PEI Paramedic Academy',
-                'Prince Edward Island University',
-                'l\'Île College'
-            ]
-            
             # Create case-insensitive filter
-            institution_mask = df['Institution of Study'].str.lower().str.strip().isin([inst.lower() for inst in pei_institutions])
+            institution_mask = self._normalized_isin(df['Institution of Study'], PEI_INSTITUTION_NAMES)
             original_count = len(df)
             df_filtered = df[institution_mask].copy()
             filtered_count = len(df_filtered)
@@ -196,38 +455,54 @@ class DataProcessor:
             Dict[str, pd.DataFrame]: Dictionary containing cleaned datasets
         """
         logger.info("Preprocessing data...")
+        self._match_cache.clear()
+        self._survey_index = None
         
         if self.retention_survey is None:
+            # Only reuse cached output when we are the ones loading from disk
+            cached = self._read_cache('processed')
+            if cached is not None:
+                self._set_datasets(cached)
+                logger.info("Data preprocessing completed")
+                return cached
             self.load_data()
+            from_disk = True
+        else:
+            from_disk = False
         
         # Filter for PEI students only
         logger.info("Filtering for PEI students only...")
         self.registrations_2023 = self.filter_pei_students(self.registrations_2023)
         self.registrations_2024 = self.filter_pei_students(self.registrations_2024)
         
-        # Clean retention survey data
-        self.retention_survey['name_clean'] = self.retention_survey['Name'].apply(self.clean_names)
-        self.retention_survey['email_clean'] = self.retention_survey['Email Address'].apply(self.clean_emails)
+        # Clean retention survey data. On pandas 3 the cleaned columns, like the text columns read
+        # with the pyarrow engine, get the Arrow-backed str dtype, so .str methods run as Arrow
+        # kernels; older pandas gives object columns, where they run per value in Python
+        self.retention_survey['name_clean'] = self.clean_names_series(self.retention_survey['Name'])
+        self.retention_survey['email_clean'] = self.clean_emails_series(self.retention_survey['Email Address'])
         
         # Clean 2023 registrations
         if self.registrations_2023 is not None and not self.registrations_2023.empty:
-            self.registrations_2023['name_clean'] = self.registrations_2023['Name'].apply(self.clean_names)
-            self.registrations_2023['email_clean'] = self.registrations_2023['Email'].apply(self.clean_emails)
+            self.registrations_2023['name_clean'] = self.clean_names_series(self.registrations_2023['Name'])
+            self.registrations_2023['email_clean'] = self.clean_emails_series(self.registrations_2023['Email'])
             self.registrations_2023['enrollment_date'] = pd.to_datetime(self.registrations_2023['Date of Enrollment'], errors='coerce')
         
         # Clean 2024 registrations
         if self.registrations_2024 is not None and not self.registrations_2024.empty:
-            self.registrations_2024['name_clean'] = self.registrations_2024['Name'].apply(self.clean_names)
-            self.registrations_2024['email_clean'] = self.registrations_2024['Email'].apply(self.clean_emails)
+            self.registrations_2024['name_clean'] = self.clean_names_series(self.registrations_2024['Name'])
+            self.registrations_2024['email_clean'] = self.clean_emails_series(self.registrations_2024['Email'])
             self.registrations_2024['enrollment_date'] = pd.to_datetime(self.registrations_2024['Date of Enrollment'], errors='coerce')
         
         logger.info("Data preprocessing completed")
         
-        return {
+        frames = {
             'retention_survey': self.retention_survey,
             'registrations_2023': self.registrations_2023,
             'registrations_2024': self.registrations_2024
         }
+        if from_disk:
+            self._write_cache('processed', frames)
+        return frames
     
     def find_name_matches(self, name: str, candidate_names: List[str], threshold: int = 80) -> List[Tuple[str, int]]:
         """
@@ -244,21 +519,51 @@ class DataProcessor:
         if not name or not candidate_names:
             return []
         
-        matches = process.extract(name, candidate_names, limit=5)
-        return [(match[0], match[1]) for match in matches if match[1] >= threshold]
+        # Scores are rounded as fuzzywuzzy reported them, so a 79.6 counts as 80; score_cutoff
+        # lets rapidfuzz abandon a candidate as soon as it cannot round up to the threshold
+        matches = process.extract(name, candidate_names, scorer=fuzz.WRatio, processor=fuzzy_process,
+                                  limit=5, score_cutoff=threshold - 0.5)
+        return [(match[0], round(match[1])) for match in matches if round(match[1]) >= threshold]
+    
+    def _get_survey_index(self) -> Dict:
+        """
+        Survey names, statuses and exact-match lookups shared by every match_members call.
+        
+        Built on first use after each load or preprocess (or after retention_survey is
+        replaced), so the per-year matching does not rebuild the same lists and
+        dictionaries from the survey again.
+        
+        Returns:
+            Dict: 'names' (list) and 'status' (array) in survey row order, plus
+            'name_lookup' and 'email_lookup' mapping non-empty cleaned values to Status
+        """
+        if self._survey_index is None or self._survey_index_source is not self.retention_survey:
+            names = self.retention_survey['name_clean'].tolist()
+            emails = self.retention_survey['email_clean'].tolist()
+            status = self.retention_survey['Status'].to_numpy()
+            self._survey_index = {
+                'names': names,
+                'status': status,
+                'name_lookup': {name: value for name, value in zip(names, status) if name},
+                'email_lookup': {email: value for email, value in zip(emails, status) if email}
+            }
+            self._survey_index_source = self.retention_survey
+        return self._survey_index
     
     def match_members(self, year: int) -> pd.DataFrame:
         """
         Match members between registration data and retention survey.
         
+        Results are cached per year until the data is reloaded or preprocessed again, or
+        the year's registrations or the survey frame is replaced; each call returns its
+        own copy, so callers may modify it freely.
+        
         Args:
             year (int): Year to analyze (2023 or 2024)
             
         Returns:
             pd.DataFrame: Matched data with retention status
         """
-        logger.info(f"Matching members for year {year}...")
-        
         if year == 2023:
             registrations = self.registrations_2023
         elif year == 2024:
@@ -266,48 +571,103 @@ class DataProcessor:
         else:
             raise ValueError("Year must be 2023 or 2024")
         
+        source = (registrations, self.retention_survey)
+        cached = self._match_cache.get(year)
+        if cached is not None and all(current is previous for current, previous in zip(source, cached[0])):
+            logger.info(f"Using cached member matches for year {year}")
+            return cached[1].copy()
+        
+        logger.info(f"Matching members for year {year}...")
+        
         # Create results DataFrame
         results = registrations.copy()
         results['retention_status'] = 'Unknown'
         results['match_type'] = 'None'
         results['match_confidence'] = 0
         
-        # Create lookup dictionaries for fast matching
-        survey_name_lookup = dict(zip(self.retention_survey['name_clean'], self.retention_survey['Status']))
-        survey_email_lookup = dict(zip(self.retention_survey['email_clean'], self.retention_survey['Status']))
+        if results.empty:
+            # Empty registrations are never cleaned, so there is nothing to match on
+            self._match_cache[year] = (source, results)
+            return results.copy()
         
-        for idx, row in results.iterrows():
-            name_clean = row['name_clean']
-            email_clean = row['email_clean']
-            
-            # Try exact email match first
-            if email_clean and email_clean in survey_email_lookup:
-                results.at[idx, 'retention_status'] = survey_email_lookup[email_clean]
-                results.at[idx, 'match_type'] = 'Email'
-                results.at[idx, 'match_confidence'] = 100
-                continue
-            
-            # Try exact name match
-            if name_clean and name_clean in survey_name_lookup:
-                results.at[idx, 'retention_status'] = survey_name_lookup[name_clean]
-                results.at[idx, 'match_type'] = 'Name_Exact'
-                results.at[idx, 'match_confidence'] = 100
-                continue
-            
-            # Try fuzzy name matching
-            if name_clean:
-                name_matches = self.find_name_matches(name_clean, list(self.retention_survey['name_clean']))
-                if name_matches:
-                    best_match, confidence = name_matches[0]
-                    if confidence >= 85:  # High confidence threshold
-                        match_idx = self.retention_survey[self.retention_survey['name_clean'] == best_match].index[0]
-                        results.at[idx, 'retention_status'] = self.retention_survey.at[match_idx, 'Status']
-                        results.at[idx, 'match_type'] = 'Name_Fuzzy'
-                        results.at[idx, 'match_confidence'] = confidence
+        survey = self._get_survey_index()
+        survey_name_lookup = survey['name_lookup']
+        survey_email_lookup = survey['email_lookup']
+        
+        name_clean = results['name_clean']
+        email_clean = results['email_clean']
+        has_name = name_clean.ne('')
+        
+        # Try exact email match first, then exact name match; membership is tested
+        # on the lookup keys (which exclude empty values) so a survey row with a
+        # missing Status still counts and blank registrations never match
+        email_match = email_clean.isin(list(survey_email_lookup))
+        name_match = ~email_match & name_clean.isin(list(survey_name_lookup))
+        
+        results.loc[email_match, 'retention_status'] = email_clean[email_match].map(survey_email_lookup)
+        results.loc[email_match, 'match_type'] = 'Email'
+        results.loc[email_match, 'match_confidence'] = 100
+        
+        results.loc[name_match, 'retention_status'] = name_clean[name_match].map(survey_name_lookup)
+        results.loc[name_match, 'match_type'] = 'Name_Exact'
+        results.loc[name_match, 'match_confidence'] = 100
+        
+        # Remaining named rows are fuzzy matched in one bulk pass
+        fuzzy_index = results.index[has_name & ~email_match & ~name_match].tolist()
+        self._apply_fuzzy_matches(results, fuzzy_index)
         
         logger.info(f"Matching completed for {year}. Found {len(results[results['retention_status'] != 'Unknown'])} matches.")
         
-        return results
+        self._match_cache[year] = (source, results)
+        return results.copy()
+    
+    def _apply_fuzzy_matches(self, results: pd.DataFrame, index: List) -> None:
+        """
+        Fuzzy match the given rows against all survey names in a single score matrix.
+        
+        Scores every distinct query name against every survey name at once with
+        rapidfuzz's cdist (WRatio, multi-threaded C++) and takes the best survey row
+        per query; ties go to the first survey row, as with a sequential search.
+        rapidfuzz already scores names with bit-parallel kernels, so there is no
+        separate edit-distance implementation to maintain here.
+        
+        Names are prepared and scores rounded as fuzzywuzzy did, so results agree with
+        the original matcher except where rapidfuzz's exact partial-ratio alignment beats
+        fuzzywuzzy's heuristic one, which can raise a partial score by a point or so.
+        check_fuzzy_matching.py compares the two on the cases where they can disagree.
+
+        Args:
+            results (pd.DataFrame): Match results, updated in place
+            index (List): Index labels of the rows to fuzzy match
+        """
+        survey = self._get_survey_index()
+        survey_names = survey['names']
+        if not index or not survey_names:
+            return
+        
+        # No length-difference prefilter: WRatio takes the best of partial and token-set
+        # scores, so "john smith" vs "john michael smith" still reaches 85. The plain
+        # ratio's length bound is already applied inside rapidfuzz via score_cutoff.
+        # Repeated names are scored once and the result fanned back out to their rows
+        query_codes, query_names = pd.factorize(results.loc[index, 'name_clean'])
+        # Scores are rounded to whole points, as fuzzywuzzy reported them, so a pair scoring
+        # 84.6 still reaches the threshold; pairs that cannot round up to it are left at 0
+        scores = np.rint(process.cdist(
+            query_names.tolist(), survey_names,
+            scorer=fuzz.WRatio, processor=fuzzy_process,
+            score_cutoff=FUZZY_MATCH_THRESHOLD - 0.5, dtype=np.float64, workers=-1
+        ))
+        best = scores.argmax(axis=1)
+        confidence = scores[np.arange(len(query_names)), best][query_codes]
+        best = best[query_codes]
+        matched = confidence >= FUZZY_MATCH_THRESHOLD
+        if not matched.any():
+            return
+        
+        rows = np.asarray(index, dtype=object)[matched]
+        results.loc[rows, 'retention_status'] = survey['status'][best[matched]]
+        results.loc[rows, 'match_type'] = 'Name_Fuzzy'
+        results.loc[rows, 'match_confidence'] = confidence[matched].astype(int)
     
     def get_data_summary(self) -> Dict[str, Dict]:
         """
@@ -7,12 +7,22 @@ then analyzes retention patterns for graduates vs current students.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Normalized "Student Status" values and the graduation status they map to
+STUDENT_STATUS_MAP = {
+    'graduate': 'Graduate',
+    'graduated': 'Graduate',
+    'current student': 'Current Student',
+    'student': 'Current Student',
+    'current': 'Current Student'
+}
+
 
 class GraduationAnalyzer:
     """
@@ -28,6 +38,11 @@ class GraduationAnalyzer:
         """
         self.data_processor = data_processor
         
+        # Matched members with graduation_status, per year, shared by analysis and export,
+        # and the data processor frames each year's entry was built from
+        self._annotated: Dict[int, pd.DataFrame] = {}
+        self._annotated_sources: Dict[int, Tuple] = {}
+        
         # Program duration mapping (in years)
         self.program_durations = {
             # Bachelor's programs (4 years)
@@ -74,26 +89,43 @@ class GraduationAnalyzer:
         Returns:
             str: 'Graduate', 'Current Student', or 'Unknown'
         """
-        if pd.isna(student_status) or student_status == "":
+        if pd.isna(student_status):
             return 'Unknown'
         
-        # Clean and standardize the student status
-        status_clean = str(student_status).strip().lower()
+        # Standardize the value and map actual student status values
+        return STUDENT_STATUS_MAP.get(str(student_status).strip().casefold(), 'Unknown')
+    
+    def classify_graduation_statuses(self, student_status: pd.Series) -> pd.Series:
+        """
+        Classify a whole "Student Status" column.
         
-        # Map actual student status values
-        if status_clean in ['graduate', 'graduated']:
-            return 'Graduate'
-        elif status_clean in ['current student', 'student', 'current']:
-            return 'Current Student'
-        else:
-            # Log unexpected values for debugging
-            logger.warning(f"Unexpected student status value: '{student_status}'")
-            return 'Unknown'
+        Each distinct value is classified once and the result mapped back onto the
+        column; unexpected values are logged together in a single warning.
+        
+        Args:
+            student_status (pd.Series): "Student Status" column from registration data
+            
+        Returns:
+            pd.Series: 'Graduate', 'Current Student', or 'Unknown' per row
+        """
+        status_lookup = {
+            status: self.classify_graduation_status(status)
+            for status in student_status.dropna().unique()
+        }
+        
+        # Log unexpected values for debugging, once per column rather than per value
+        unexpected = sorted(str(status) for status, graduation_status in status_lookup.items()
+                            if graduation_status == 'Unknown' and str(status).strip())
+        if unexpected:
+            logger.warning(f"Unexpected student status values: {unexpected}")
+        
+        return student_status.map(status_lookup).fillna('Unknown')
     
     def _estimate_program_duration(self, program_lower: str) -> float:
         """Estimate program duration based on program name."""
         
-        # Check for exact matches first
+        # Check for exact matches first. The first keyword in dict order wins, which one
+        # leftmost-match regex alternation cannot express, so this stays a plain loop
         for keyword, duration in self.program_durations.items():
             if keyword in program_lower:
                 return duration
@@ -108,6 +140,37 @@ class GraduationAnalyzer:
         else:
             return 2  # Default to 2 years if unsure
     
+    def _annotated_matches(self, year: int) -> pd.DataFrame:
+        """
+        Matched members with a valid retention status and their graduation status.
+        
+        Computed once per year and reused (and rebuilt if the data processor reloads or
+        re-cleans its data), so exporting after analyzing does not match and classify
+        the same members again. Callers must not modify it.
+        
+        Args:
+            year (int): Year to analyze (2023 or 2024)
+            
+        Returns:
+            pd.DataFrame: Matched rows with an added 'graduation_status' column
+        """
+        survey_data = self.data_processor.retention_survey
+        source = (getattr(self.data_processor, f'registrations_{year}', None), survey_data,
+                  survey_data['name_clean'].array)
+        cached_source = self._annotated_sources.get(year)
+        if cached_source is None or any(
+                current is not cached for current, cached in zip(source, cached_source)):
+            matched_data = self.data_processor.match_members(year)
+            # Filter for only valid retention statuses
+            valid_retention_statuses = ['Still in PEI', 'No longer in PEI', 'Inconclusive']
+            matched_only = matched_data[matched_data['retention_status'].isin(valid_retention_statuses)].copy()
+            
+            # Add graduation classification
+            matched_only['graduation_status'] = self.classify_graduation_statuses(matched_only['Student Status'])
+            self._annotated[year] = matched_only
+            self._annotated_sources[year] = source
+        return self._annotated[year]
+    
     def analyze_graduation_retention(self, year: int) -> Dict[str, any]:
         """
         Analyze retention patterns by graduation status.
@@ -120,54 +183,45 @@ class GraduationAnalyzer:
         """
         logger.info(f"Analyzing graduation retention for {year}...")
         
-        # Get matched data
-        matched_data = self.data_processor.match_members(year)
-        # Filter for only valid retention statuses
-        valid_retention_statuses = ['Still in PEI', 'No longer in PEI', 'Inconclusive']
-        matched_only = matched_data[matched_data['retention_status'].isin(valid_retention_statuses)].copy()
-        
-        # Add graduation classification
-        matched_only['graduation_status'] = matched_only.apply(
-            lambda row: self.classify_graduation_status(
-                row['Student Status'], 
-                row['Program of Study'], 
-                row['Date of Enrollment']
-            ), axis=1
-        )
+        # Get matched data with graduation classification
+        matched_only = self._annotated_matches(year)
         
         # Analyze by graduation status
         graduation_analysis = {}
         
+        # Retention counts for every graduation status in one aggregation
+        retention_buckets = ['Still in PEI', 'No longer in PEI', 'Inconclusive']
+        counts = pd.crosstab(matched_only['graduation_status'], matched_only['retention_status'])
+        counts = counts.reindex(columns=retention_buckets, fill_value=0)
+        totals = counts.sum(axis=1)
+        percentages = counts.div(totals, axis=0) * 100
+        
         for grad_status in ['Graduate', 'Current Student', 'Unknown']:
-            subset = matched_only[matched_only['graduation_status'] == grad_status]
-            
-            if len(subset) > 0:
-                retention_counts = subset['retention_status'].value_counts()
-                total = len(subset)
-                
+            if grad_status in counts.index:
                 graduation_analysis[grad_status] = {
-                    'total_members': total,
+                    'total_members': int(totals[grad_status]),
                     'retention_breakdown': {
-                        'Still in PEI': retention_counts.get('Still in PEI', 0),
-                        'No longer in PEI': retention_counts.get('No longer in PEI', 0),
-                        'Inconclusive': retention_counts.get('Inconclusive', 0)
+                        bucket: int(counts.at[grad_status, bucket]) for bucket in retention_buckets
                     },
                     'retention_percentages': {
-                        'Still in PEI': (retention_counts.get('Still in PEI', 0) / total) * 100,
-                        'No longer in PEI': (retention_counts.get('No longer in PEI', 0) / total) * 100,
-                        'Inconclusive': (retention_counts.get('Inconclusive', 0) / total) * 100
+                        bucket: float(percentages.at[grad_status, bucket]) for bucket in retention_buckets
                     }
                 }
         
         # Overall summary
         total_analyzed = len(matched_only)
+        status_counts = matched_only['graduation_status'].value_counts()
+        graduation_distribution = {
+            status: int(status_counts.get(status, 0))
+            for status in ['Graduate', 'Current Student', 'Unknown']
+        }
         graduation_summary = {
             'year': year,
             'total_analyzed': total_analyzed,
-            'graduation_distribution': {
-                'Graduate': len(matched_only[matched_only['graduation_status'] == 'Graduate']),
-                'Current Student': len(matched_only[matched_only['graduation_status'] == 'Current Student']),
-                'Unknown': len(matched_only[matched_only['graduation_status'] == 'Unknown'])
+            'graduation_distribution': graduation_distribution,
+            'graduation_percentages': {
+                status: (count / total_analyzed * 100) if total_analyzed > 0 else 0
+                for status, count in graduation_distribution.items()
             },
             'by_graduation_status': graduation_analysis,
             'key_insights': self._generate_graduation_insights(graduation_analysis, year)
@@ -206,8 +260,13 @@ class GraduationAnalyzer:
         """Compare graduation retention patterns between 2023 and 2024."""
         logger.info("Comparing graduation retention between 2023 and 2024...")
         
-        analysis_2023 = self.analyze_graduation_retention(2023)
-        analysis_2024 = self.analyze_graduation_retention(2024)
+        # The years are independent and cached under separate keys. Threads (not
+        # processes) keep those caches for a later export, and the fuzzy matching
+        # runs in rapidfuzz without holding the GIL.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future_2023 = executor.submit(self.analyze_graduation_retention, 2023)
+            future_2024 = executor.submit(self.analyze_graduation_retention, 2024)
+            analysis_2023, analysis_2024 = future_2023.result(), future_2024.result()
         
         comparison = {
             '2023': analysis_2023,
@@ -239,26 +298,12 @@ class GraduationAnalyzer:
         if filename is None:
             filename = "graduation_retention_analysis.csv"
         
-        # Get both years' data
-        matched_2023 = self.data_processor.match_members(2023)
-        matched_2024 = self.data_processor.match_members(2024)
-        
-        # Add graduation status
-        for df, year in [(matched_2023, 2023), (matched_2024, 2024)]:
-            df['graduation_status'] = df.apply(
-                lambda row: self.classify_graduation_status(
-                    row['Student Status'], 
-                    row['Program of Study'], 
-                    row['Date of Enrollment']
-                ), axis=1
-            )
-            df['analysis_year'] = year
-        
-        # Combine and export
-        combined = pd.concat([matched_2023, matched_2024], ignore_index=True)
-        # Filter for only valid retention statuses
-        valid_retention_statuses = ['Still in PEI', 'No longer in PEI', 'Inconclusive']
-        combined = combined[combined['retention_status'].isin(valid_retention_statuses)]
+        # Combine both years' classified matches; the keys become the analysis_year column
+        years = [2023, 2024]
+        combined = pd.concat(
+            [self._annotated_matches(year) for year in years],
+            keys=years, names=['analysis_year']
+        ).reset_index(level=0)
         
         # Select relevant columns
         export_columns = [
@@ -7,14 +7,50 @@ to improve the matching rate between registration and retention survey data.
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from typing import Dict, List, Tuple, Optional
 import re
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+import jellyfish
 import logging
+from collections import Counter, defaultdict
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Patterns used when matching and reporting on unmatched records, compiled once
+VOWEL_RE = re.compile(r'[aeiou]')
+NAME_PREFIX_RE = re.compile(r'\b(mr\.?|mrs\.?|ms\.?|dr\.?|prof\.?)\b')
+NON_WORD_RE = re.compile(r'[^\w\s]')
+# Patterns for the pandas .str methods, which compile them with the column's own regex engine
+EMAIL_DOMAIN_PATTERN = r'@(.+)'
+SPECIAL_CHAR_PATTERN = r'[^\w\s]'
+
+# Registration fields kept for each unmatched record in analyze_unmatched_records
+UNMATCHED_RECORD_COLUMNS = [
+    'Name', 'Email', 'Institution of Study', 'Program of Study', 'Country of Origin',
+    'Date of Enrollment', 'name_clean', 'email_clean'
+]
+
+# Potential matches suggested per unmatched record for manual review
+MAX_POTENTIAL_MATCHES = 5
+
+# Common nickname mappings (full first name -> nickname) and their reverse
+NICKNAMES = {
+    'william': 'bill', 'robert': 'bob', 'james': 'jim', 'richard': 'rick',
+    'michael': 'mike', 'david': 'dave', 'christopher': 'chris',
+    'matthew': 'matt', 'anthony': 'tony', 'joseph': 'joe',
+    'daniel': 'dan', 'andrew': 'andy', 'kenneth': 'ken',
+    'elizabeth': 'liz', 'patricia': 'pat', 'jennifer': 'jen',
+    'margaret': 'meg', 'catherine': 'kate', 'stephanie': 'steph'
+}
+FULL_NAMES = {nickname: full for full, nickname in NICKNAMES.items()}
+
+# Query x choice pairs scored per rapidfuzz call (about 32 MB of float scores)
+SCORE_BLOCK_CELLS = 4_000_000
+
 
 class MatchingAnalyzer:
     """
@@ -33,6 +69,9 @@ class MatchingAnalyzer:
         if self.data_processor.retention_survey is None:
             self.data_processor.preprocess_data()
         self.unmatched_analysis = {}
+        # Survey lookup tables and the survey columns they were built from
+        self._survey_lookup: Optional[Dict] = None
+        self._survey_lookup_source: Optional[Tuple] = None
         
     def analyze_unmatched_records(self, year: int) -> Dict[str, any]:
         """
@@ -66,7 +105,10 @@ class MatchingAnalyzer:
             'total_registrations': len(registrations),
             'total_unmatched': len(unmatched),
             'unmatched_percentage': (len(unmatched) / len(registrations)) * 100,
-            'unmatched_records': unmatched.to_dict('records'),
+            'unmatched_records': [
+                dict(zip(UNMATCHED_RECORD_COLUMNS, row))
+                for row in unmatched[UNMATCHED_RECORD_COLUMNS].itertuples(index=False, name=None)
+            ],
             'patterns': self._analyze_unmatched_patterns(unmatched),
             'potential_matches': self._find_potential_matches(unmatched, year),
             'suggestions': self._generate_matching_suggestions(unmatched)
@@ -80,138 +122,272 @@ class MatchingAnalyzer:
         patterns = {}
         
         # Institution breakdown
-        patterns['by_institution'] = unmatched['Institution of Study'].value_counts().to_dict()
+        patterns['by_institution'] = self._count_values(unmatched['Institution of Study'])
         
         # Program breakdown
-        patterns['by_program'] = unmatched['Program of Study'].value_counts().to_dict()
+        patterns['by_program'] = self._count_values(unmatched['Program of Study'])
         
         # Country breakdown
-        patterns['by_country'] = unmatched['Country of Origin'].value_counts().to_dict()
+        patterns['by_country'] = self._count_values(unmatched['Country of Origin'])
         
         # Email domain analysis
-        unmatched['email_domain'] = unmatched['email_clean'].str.extract(r'@(.+)')
-        patterns['by_email_domain'] = unmatched['email_domain'].value_counts().to_dict()
+        unmatched['email_domain'] = unmatched['email_clean'].str.extract(EMAIL_DOMAIN_PATTERN)
+        patterns['by_email_domain'] = self._count_values(unmatched['email_domain'])
         
         # Name characteristics
+        name_lengths = unmatched['name_clean'].str.len()
         patterns['name_characteristics'] = {
-            'avg_name_length': unmatched['name_clean'].str.len().mean(),
-            'names_with_special_chars': len(unmatched[unmatched['Name'].str.contains(r'[^\w\s]', na=False)]),
-            'very_short_names': len(unmatched[unmatched['name_clean'].str.len() < 5]),
-            'very_long_names': len(unmatched[unmatched['name_clean'].str.len() > 30])
+            'avg_name_length': name_lengths.mean(),
+            'names_with_special_chars': int(unmatched['Name'].str.contains(SPECIAL_CHAR_PATTERN, na=False).sum()),
+            'very_short_names': int((name_lengths < 5).sum()),
+            'very_long_names': int((name_lengths > 30).sum())
         }
         
         return patterns
     
-    def _find_potential_matches(self, unmatched: pd.DataFrame, year: int) -> List[Dict]:
-        """Find potential matches using more relaxed criteria."""
-        potential_matches = []
-        survey_data = self.data_processor.retention_survey
+    def _count_values(self, values: pd.Series) -> Dict[str, int]:
+        """Count non-null values, most common first, without building an intermediate Series."""
+        return dict(Counter(values.dropna().to_numpy(dtype=object)).most_common())
+    
+    def _score_matrix(self, queries: List[str], choices: List[str], scorer,
+                      processor=None, min_score: int = 0) -> np.ndarray:
+        """
+        Score every query against every choice in one multi-threaded rapidfuzz call.
+        
+        Scores are rounded to whole points, as fuzzywuzzy reported them. Pairs that
+        cannot round up to min_score are left at 0 so rapidfuzz can skip them early.
         
-        for idx, person in unmatched.iterrows():
-            name = person['name_clean']
-            email = person['email_clean']
+        Args:
+            queries (List[str]): Strings to match
+            choices (List[str]): Candidate strings
+            scorer: rapidfuzz scorer, e.g. fuzz.WRatio or fuzz.ratio
+            processor: Optional preprocessing applied to both sides
+            min_score (int): Lowest rounded score the caller is interested in
             
-            # Try different matching strategies
-            matches = []
+        Returns:
+            np.ndarray: (len(queries), len(choices)) integer scores
+        """
+        scores = np.empty((len(queries), len(choices)), dtype=np.int16)
+        # Score in row blocks so the unrounded float scores never need a full-size matrix
+        step = max(SCORE_BLOCK_CELLS // max(len(choices), 1), 1)
+        for start in range(0, len(queries), step):
+            block = process.cdist(queries[start:start + step], choices, scorer=scorer, processor=processor,
+                                  score_cutoff=max(min_score - 0.5, 0), dtype=np.float64, workers=-1)
+            scores[start:start + step] = np.rint(block)
+        return scores
+    
+    def _top_name_matches(self, queries: List[str], choices: List[str], limit: int,
+                          min_score: int, scorer=fuzz.WRatio) -> List[List[Tuple[int, int]]]:
+        """
+        Best-scoring choices for each query, like fuzzywuzzy's process.extract.
+        
+        Names are scored after default processing; ties go to the earlier choice.
+        Only matches scoring at least min_score are returned.
+        
+        Args:
+            queries (List[str]): Names to match
+            choices (List[str]): Candidate names
+            limit (int): Number of top choices considered per query
+            min_score (int): Minimum score for a match to be returned
+            scorer: rapidfuzz scorer, WRatio by default
+            
+        Returns:
+            List[List[Tuple[int, int]]]: Per query, (choice position, score) pairs, best first
+        """
+        if not queries or not choices:
+            return [[] for _ in queries]
+        
+        scores = self._score_matrix(queries, choices, scorer, default_process, min_score)
+        top = np.argsort(-scores, axis=1, kind='stable')[:, :limit]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        return [
+            [(choice, score) for choice, score in zip(row, row_scores) if score >= min_score]
+            for row, row_scores in zip(top.tolist(), top_scores.tolist())
+        ]
+    
+    def _first_rows(self, values: List[str]) -> Dict[str, int]:
+        """Map each value to the position of its first occurrence, for O(1) row lookups."""
+        first_rows = {}
+        for row, value in enumerate(values):
+            first_rows.setdefault(value, row)
+        return first_rows
+    
+    def _survey_lookups(self) -> Dict:
+        """
+        Survey columns, row lookups and blocking indices shared by every matching strategy.
+        
+        Built once per retention survey (and rebuilt if the data processor reloads or
+        re-cleans it), so repeated years, thresholds and reports reuse the same tables.
+        
+        Returns:
+            Dict: In survey row order, 'names', 'emails', 'status', 'consonants' and
+            'usernames' lists plus 'records' (the fields reported for a match);
+            'known_names' holds the non-blank names, the choices for name scoring;
+            'name_to_row' / 'email_to_row' map a value to its first row; 'domain_rows' and
+            'metaphone_rows' map a block key to its rows; 'consonant_rows' and 'email_rows'
+            list the rows usable by the phonetic fallback and username strategies
+        """
+        survey_data = self.data_processor.retention_survey
+        source = (survey_data, survey_data['name_clean'].array, survey_data['email_clean'].array)
+        if self._survey_lookup_source is None or any(
+                current is not cached for current, cached in zip(source, self._survey_lookup_source)):
+            names = survey_data['name_clean'].tolist()
+            emails = survey_data['email_clean'].tolist()
+            consonants = [VOWEL_RE.sub('', name.lower()) if not pd.isna(name) else '' for name in names]
+            has_at = [not pd.isna(email) and '@' in email for email in emails]
+            
+            metaphone_rows = defaultdict(list)
+            for row, name in enumerate(names):
+                if name:
+                    metaphone_rows[jellyfish.metaphone(name)].append(row)
+            
+            # Block survey rows by email domain so usernames are only compared within a domain
+            survey_domains = survey_data['email_clean'].str.split('@').str[1]
+            
+            self._survey_lookup = {
+                'names': names,
+                'known_names': [name for name in names if not pd.isna(name) and name],
+                'emails': emails,
+                'status': survey_data['Status'].tolist(),
+                'consonants': consonants,
+                'usernames': [email.split('@')[0] if at else '' for email, at in zip(emails, has_at)],
+                'records': [
+                    {'matched_name': name, 'matched_email': email, 'status': status}
+                    for name, email, status in zip(survey_data['Name'].tolist(),
+                                                   survey_data['Email Address'].tolist(),
+                                                   survey_data['Status'].tolist())
+                ],
+                'name_to_row': self._first_rows(names),
+                'email_to_row': self._first_rows(emails),
+                'domain_rows': survey_data.groupby(survey_domains.to_numpy(), sort=False).indices,
+                'metaphone_rows': dict(metaphone_rows),
+                'consonant_rows': [row for row, value in enumerate(consonants) if len(value) > 3],
+                'email_rows': [row for row, at in enumerate(has_at) if at]
+            }
+            self._survey_lookup_source = source
+        return self._survey_lookup
+    
+    def _first_hits(self, queries: List[str], choices: List[str], scorer,
+                    min_score: int) -> List[Optional[Tuple[int, int]]]:
+        """
+        First choice, in order, scoring at least min_score against each query.
+        
+        Args:
+            queries (List[str]): Strings to match
+            choices (List[str]): Candidate strings, in priority order
+            scorer: rapidfuzz scorer, e.g. fuzz.ratio
+            min_score (int): Minimum score for a hit
             
-            # 1. Partial name matching
+        Returns:
+            List[Optional[Tuple[int, int]]]: Per query, (choice position, score) or None
+        """
+        if not queries or not choices:
+            return [None for _ in queries]
+        
+        scores = self._score_matrix(queries, choices, scorer, min_score=min_score)
+        hits = scores >= min_score
+        first = hits.argmax(axis=1)
+        return [
+            (choice, int(scores[row, choice])) if hits[row, choice] else None
+            for row, choice in enumerate(first.tolist())
+        ]
+    
+    def _find_potential_matches(self, unmatched: pd.DataFrame, year: int) -> List[Dict]:
+        """Find potential matches using more relaxed criteria."""
+        potential_matches = []
+        survey = self._survey_lookups()
+        known_names = survey['known_names']
+        survey_records = survey['records']
+        name_to_row = survey['name_to_row']
+        names = unmatched['name_clean'].tolist()
+        emails = unmatched['email_clean'].tolist()
+        
+        # 1. Partial name matching (first + last name combinations), scored in bulk
+        first_last_queries = {}
+        for position, name in enumerate(names):
             if name:
                 name_parts = name.split()
                 if len(name_parts) >= 2:
-                    # Try first + last name combinations
-                    first_last = f"{name_parts[0]} {name_parts[-1]}"
-                    partial_matches = process.extract(first_last, survey_data['name_clean'], limit=3)
-                    for match_result in partial_matches:
-                        match, score = match_result[0], match_result[1]
-                        if score >= 70:
-                            survey_row = survey_data[survey_data['name_clean'] == match].iloc[0]
-                            matches.append({
-                                'type': 'partial_name',
-                                'score': score,
-                                'matched_name': survey_row['Name'],
-                                'matched_email': survey_row['Email Address'],
-                                'status': survey_row['Status']
-                            })
-            
-            # 2. Email domain matching
-            if email and '@' in email:
+                    first_last_queries[position] = f"{name_parts[0]} {name_parts[-1]}"
+        
+        row_matches = [[] for _ in names]
+        partial_top = self._top_name_matches(list(first_last_queries.values()), known_names, limit=3, min_score=70)
+        for position, top in zip(first_last_queries, partial_top):
+            for choice, score in top:
+                record = survey_records[name_to_row[known_names[choice]]]
+                row_matches[position].append({'type': 'partial_name', 'score': score, **record})
+        
+        # Later strategies only run for records that still have room under the match budget
+        # 2. Email domain matching
+        for position, email in enumerate(emails):
+            if len(row_matches[position]) < MAX_POTENTIAL_MATCHES and email and '@' in email:
                 email_parts = email.split('@')
                 username = email_parts[0]
                 domain = email_parts[1]
                 
                 # Look for same domain with different username
-                same_domain = survey_data[survey_data['email_clean'].str.contains(f'@{domain}', na=False)]
-                for _, survey_row in same_domain.iterrows():
-                    survey_username = survey_row['email_clean'].split('@')[0]
-                    username_score = fuzz.ratio(username, survey_username)
-                    if username_score >= 60:
-                        matches.append({
-                            'type': 'email_domain',
-                            'score': username_score,
-                            'matched_name': survey_row['Name'],
-                            'matched_email': survey_row['Email Address'],
-                            'status': survey_row['Status']
-                        })
-            
-            # 3. Nickname/variant matching
-            if name:
-                # Common nickname patterns
-                name_variants = self._generate_name_variants(name)
-                for variant in name_variants:
-                    variant_matches = process.extract(variant, survey_data['name_clean'], limit=2)
-                    for match_result in variant_matches:
-                        match, score = match_result[0], match_result[1]
-                        if score >= 80:
-                            survey_row = survey_data[survey_data['name_clean'] == match].iloc[0]
-                            matches.append({
-                                'type': 'name_variant',
-                                'score': score,
-                                'matched_name': survey_row['Name'],
-                                'matched_email': survey_row['Email Address'],
-                                'status': survey_row['Status'],
-                                'variant_used': variant
-                            })
-            
+                block = survey['domain_rows'].get(domain)
+                if block is not None:
+                    survey_usernames = [survey['usernames'][row] for row in block]
+                    username_scores = self._score_matrix([username], survey_usernames, fuzz.ratio, min_score=60)[0]
+                    for row, username_score in zip(block.tolist(), username_scores.tolist()):
+                        if username_score >= 60:
+                            row_matches[position].append(
+                                {'type': 'email_domain', 'score': username_score, **survey_records[row]})
+        
+        # 3. Nickname/variant matching, scored in bulk. Token set scoring ignores word order
+        # and extra middle names, covering reversed and middle-name-dropped variants of a name
+        multi_part_names = {}
+        variant_queries = []
+        for position, name in enumerate(names):
+            if name and len(row_matches[position]) < MAX_POTENTIAL_MATCHES:
+                if len(name.split()) >= 2:
+                    multi_part_names[position] = name
+                variant_queries.extend((position, variant) for variant in self._generate_name_variants(name))
+        
+        variant_results = defaultdict(list)
+        token_set_top = self._top_name_matches(list(multi_part_names.values()), known_names, limit=2,
+                                               min_score=80, scorer=fuzz.token_set_ratio)
+        for (position, name), top in zip(multi_part_names.items(), token_set_top):
+            variant_results[position].append((name, top))
+        variant_top = self._top_name_matches([variant for _, variant in variant_queries], known_names,
+                                             limit=2, min_score=80)
+        for (position, variant), top in zip(variant_queries, variant_top):
+            variant_results[position].append((variant, top))
+        
+        for position, results in variant_results.items():
+            for variant, top in results:
+                for choice, score in top:
+                    record = survey_records[name_to_row[known_names[choice]]]
+                    row_matches[position].append(
+                        {'type': 'name_variant', 'score': score, **record, 'variant_used': variant})
+        
+        registration_names = unmatched['Name'].tolist()
+        registration_emails = unmatched['Email'].tolist()
+        for position, matches in enumerate(row_matches):
             if matches:
                 potential_matches.append({
-                    'registration_name': person['Name'],
-                    'registration_email': person['Email'],
-                    'potential_matches': matches[:5]  # Top 5 matches
+                    'registration_name': registration_names[position],
+                    'registration_email': registration_emails[position],
+                    'potential_matches': matches[:MAX_POTENTIAL_MATCHES]
                 })
         
         return potential_matches
     
     def _generate_name_variants(self, name: str) -> List[str]:
-        """Generate common name variants and nicknames."""
+        """Generate nickname variants; reordered names are covered by token set scoring."""
         variants = []
         name_parts = name.split()
         
         if len(name_parts) >= 2:
-            # Try reversing first and last name
-            variants.append(f"{name_parts[-1]} {name_parts[0]}")
-            
-            # Try with middle initials removed
-            if len(name_parts) > 2:
-                variants.append(f"{name_parts[0]} {name_parts[-1]}")
-            
             # Common nickname mappings
-            nickname_map = {
-                'william': 'bill', 'robert': 'bob', 'james': 'jim', 'richard': 'rick',
-                'michael': 'mike', 'david': 'dave', 'christopher': 'chris',
-                'matthew': 'matt', 'anthony': 'tony', 'joseph': 'joe',
-                'daniel': 'dan', 'andrew': 'andy', 'kenneth': 'ken',
-                'elizabeth': 'liz', 'patricia': 'pat', 'jennifer': 'jen',
-                'margaret': 'meg', 'catherine': 'kate', 'stephanie': 'steph'
-            }
-            
             first_name = name_parts[0].lower()
-            if first_name in nickname_map:
-                variants.append(f"{nickname_map[first_name]} {' '.join(name_parts[1:])}")
+            if first_name in NICKNAMES:
+                variants.append(f"{NICKNAMES[first_name]} {' '.join(name_parts[1:])}")
             
             # Check reverse (nickname to full name)
-            for full, nick in nickname_map.items():
-                if first_name == nick:
-                    variants.append(f"{full} {' '.join(name_parts[1:])}")
+            if first_name in FULL_NAMES:
+                variants.append(f"{FULL_NAMES[first_name]} {' '.join(name_parts[1:])}")
         
         return variants
     
@@ -223,27 +399,33 @@ class MatchingAnalyzer:
             suggestions.append("High number of unmatched records suggests data quality issues")
             suggestions.append("Consider reviewing data entry processes for consistency")
         
-        # Check for email patterns
-        email_domains = unmatched['email_clean'].str.extract(r'@(.+)')[0].value_counts()
+        # Check for email patterns, reusing the domains extracted by _analyze_unmatched_patterns
+        if 'email_domain' in unmatched:
+            email_domains = unmatched['email_domain'].value_counts()
+        else:
+            email_domains = unmatched['email_clean'].str.extract(EMAIL_DOMAIN_PATTERN)[0].value_counts()
         if len(email_domains) > 0:
             top_domain = email_domains.index[0]
             suggestions.append(f"Most common email domain in unmatched: {top_domain}")
             suggestions.append("Consider reaching out to institution IT for email format standards")
         
         # Check name patterns
-        short_names = len(unmatched[unmatched['name_clean'].str.len() < 10])
+        short_names = int((unmatched['name_clean'].str.len() < 10).sum())
         if short_names > len(unmatched) * 0.3:
             suggestions.append("Many unmatched records have short names - possible incomplete data")
         
         return suggestions
     
-    def improved_matching(self, year: int, confidence_threshold: int = 75) -> pd.DataFrame:
+    def improved_matching(self, year: int, confidence_threshold: int = 75,
+                          original_results: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         """
         Perform improved matching with relaxed criteria.
         
         Args:
             year (int): Year to analyze
             confidence_threshold (int): Minimum confidence score for matches
+            original_results (pd.DataFrame, optional): match_members results for the year,
+                if the caller already has them; they are not modified
             
         Returns:
             DataFrame with improved matching results
@@ -251,74 +433,106 @@ class MatchingAnalyzer:
         logger.info(f"Running improved matching for {year} with threshold {confidence_threshold}...")
         
         # Get original matching results
-        original_results = self.data_processor.match_members(year)
+        if original_results is None:
+            original_results = self.data_processor.match_members(year)
+        else:
+            original_results = original_results.copy()
         
         # Work on the unmatched records
         unmatched = original_results[original_results['retention_status'] == 'Unknown'].copy()
-        survey_data = self.data_processor.retention_survey
-        
-        improvements = 0
-        
-        for idx, person in unmatched.iterrows():
-            name = person['name_clean']
-            email = person['email_clean']
-            
-            best_match = None
-            best_score = 0
-            match_type = None
-            
-            # Strategy 1: Partial name matching (first + last name only)
-            if name and not best_match:
-                name_parts = name.split()
-                if len(name_parts) >= 2:
-                    first_last = f"{name_parts[0]} {name_parts[-1]}"
-                    name_matches = process.extract(first_last, survey_data['name_clean'], limit=3)
-                    for match_result in name_matches:
-                        match_name, score = match_result[0], match_result[1]
-                        if score >= confidence_threshold:
-                            best_match = match_name
-                            best_score = score
-                            match_type = 'Partial_Name'
-                            break
-            
-            # Strategy 2: Phonetic matching (sounds like)
-            if name and not best_match:
-                # Simple phonetic matching - remove vowels for comparison
-                name_consonants = re.sub(r'[aeiou]', '', name.lower())
-                for survey_name in survey_data['name_clean']:
-                    if pd.isna(survey_name):
-                        continue
-                    survey_consonants = re.sub(r'[aeiou]', '', survey_name.lower())
-                    if len(name_consonants) > 3 and len(survey_consonants) > 3:
-                        consonant_score = fuzz.ratio(name_consonants, survey_consonants)
-                        if consonant_score >= confidence_threshold + 10:  # Higher threshold for phonetic
-                            best_match = survey_name
-                            best_score = consonant_score
-                            match_type = 'Phonetic'
-                            break
-            
-            # Strategy 3: Email username matching
-            if email and '@' in email and not best_match:
-                username = email.split('@')[0]
-                for survey_email in survey_data['email_clean']:
-                    if pd.isna(survey_email) or '@' not in survey_email:
-                        continue
-                    survey_username = survey_email.split('@')[0]
-                    username_score = fuzz.ratio(username, survey_username)
-                    if username_score >= confidence_threshold:
-                        survey_row = survey_data[survey_data['email_clean'] == survey_email].iloc[0]
-                        best_match = survey_row['name_clean']
-                        best_score = username_score
-                        match_type = 'Email_Username'
-                        break
+        survey = self._survey_lookups()
+        survey_names = survey['names']
+        known_names = survey['known_names']
+        names = unmatched['name_clean'].tolist()
+        emails = unmatched['email_clean'].tolist()
+        
+        # Each strategy scores, in one bulk call, only the records earlier strategies left
+        # unmatched, against only the survey rows that strategy can use. The passes are not
+        # fused into one score tensor: a name match must take priority over a stronger
+        # phonetic one, and the later passes only need scoring for the shrinking residual
+        best_matches = {}  # position in unmatched -> (survey name_clean, match type, score)
+        
+        # Strategy 1: Partial name matching (first + last name only). A first + last name
+        # that is itself a survey name is taken directly; only the rest are fuzzy scored
+        first_lasts = {}
+        for position, name in enumerate(names):
+            name_parts = name.split() if name else []
+            if len(name_parts) >= 2:
+                first_last = f"{name_parts[0]} {name_parts[-1]}"
+                if first_last in survey['name_to_row']:
+                    best_matches[position] = (first_last, 'Partial_Name', 100)
+                else:
+                    first_lasts[position] = first_last
+        name_top = self._top_name_matches(list(first_lasts.values()), known_names, limit=1,
+                                          min_score=confidence_threshold)
+        for position, top in zip(first_lasts, name_top):
+            if top:
+                choice, score = top[0]
+                best_matches[position] = (known_names[choice], 'Partial_Name', score)
+        
+        # Strategy 2: Phonetic matching (sounds like). Survey names sharing the record's
+        # Metaphone key are looked up directly; the best of them by name similarity wins
+        for position, name in enumerate(names):
+            if name and position not in best_matches:
+                key_rows = survey['metaphone_rows'].get(jellyfish.metaphone(name))
+                if key_rows:
+                    scores = [round(fuzz.ratio(name, survey_names[row])) for row in key_rows]
+                    best = scores.index(max(scores))
+                    if scores[best] >= confidence_threshold:
+                        best_matches[position] = (survey_names[key_rows[best]], 'Phonetic', scores[best])
+        
+        # Fallback for names without a Metaphone hit - remove vowels for comparison. The
+        # consonant strings are scored in one cdist call, in rapidfuzz's native kernels
+        phonetic_threshold = confidence_threshold + 10  # Higher threshold for phonetic
+        phonetic_rows = survey['consonant_rows']
+        phonetic_queries = {}
+        for position, name in enumerate(names):
+            if name and position not in best_matches:
+                name_consonants = VOWEL_RE.sub('', name.lower())
+                if len(name_consonants) > 3:
+                    phonetic_queries[position] = name_consonants
+        phonetic_hits = self._first_hits(list(phonetic_queries.values()),
+                                         [survey['consonants'][row] for row in phonetic_rows],
+                                         fuzz.ratio, phonetic_threshold)
+        for position, hit in zip(phonetic_queries, phonetic_hits):
+            if hit:
+                choice, score = hit
+                best_matches[position] = (survey_names[phonetic_rows[choice]], 'Phonetic', score)
+        
+        # Strategy 3: Email username matching
+        email_rows = survey['email_rows']
+        username_queries = {
+            position: email.split('@')[0]
+            for position, email in enumerate(emails)
+            if email and '@' in email and position not in best_matches
+        }
+        username_hits = self._first_hits(list(username_queries.values()),
+                                         [survey['usernames'][row] for row in email_rows],
+                                         fuzz.ratio, confidence_threshold)
+        for position, hit in zip(username_queries, username_hits):
+            if hit:
+                choice, score = hit
+                # Report the name on the first survey row with that email
+                best_match = survey_names[survey['email_to_row'][survey['emails'][email_rows[choice]]]]
+                if best_match:
+                    best_matches[position] = (best_match, 'Email_Username', score)
+        
+        # Record the best match found for each improved record in column arrays
+        improvements = len(best_matches)
+        if best_matches:
+            rows = original_results.index.get_indexer(unmatched.index[list(best_matches)])
+            new_status = original_results['retention_status'].to_numpy(dtype=object, copy=True)
+            new_type = original_results['match_type'].to_numpy(dtype=object, copy=True)
+            new_conf = original_results['match_confidence'].to_numpy(copy=True)
+            for row, (best_match, match_type, score) in zip(rows, best_matches.values()):
+                new_status[row] = survey['status'][survey['name_to_row'][best_match]]
+                new_type[row] = match_type
+                new_conf[row] = score
             
-            # Apply the best match found
-            if best_match:
-                match_idx = survey_data[survey_data['name_clean'] == best_match].index[0]
-                original_results.at[idx, 'retention_status'] = survey_data.at[match_idx, 'Status']
-                original_results.at[idx, 'match_type'] = match_type
-                original_results.at[idx, 'match_confidence'] = best_score
-                improvements += 1
+            # Apply all improvements in one write per column
+            original_results['retention_status'] = new_status
+            original_results['match_type'] = new_type
+            original_results['match_confidence'] = new_conf
         
         logger.info(f"Improved matching found {improvements} additional matches")
         return original_results
@@ -362,7 +576,8 @@ class MatchingAnalyzer:
         output_dir.mkdir(exist_ok=True)
         
         filepath = output_dir / filename
-        export_data.to_csv(filepath, index=False)
+        # Arrow's C++ CSV writer avoids pandas' per-row Python formatting
+        pa_csv.write_csv(pa.Table.from_pandas(export_data, preserve_index=False), filepath)
         
         logger.info(f"Exported {len(export_data)} unmatched records to {filepath}")
         return str(filepath)
@@ -373,23 +588,38 @@ class MatchingAnalyzer:
             return ""
         
         # Remove common prefixes/suffixes and clean up
-        name = re.sub(r'\b(mr\.?|mrs\.?|ms\.?|dr\.?|prof\.?)\b', '', name.lower())
-        name = re.sub(r'[^\w\s]', ' ', name)
+        name = NAME_PREFIX_RE.sub('', name.lower())
+        name = NON_WORD_RE.sub(' ', name)
         name = ' '.join(name.split())  # Remove extra spaces
         
         # Capitalize properly
         return ' '.join(word.capitalize() for word in name.split())
     
-    def generate_matching_report(self, year: int) -> Dict[str, any]:
-        """Generate comprehensive matching report."""
+    def generate_matching_report(self, year: int, improved_results: Optional[pd.DataFrame] = None,
+                                 unmatched_analysis: Optional[Dict] = None) -> Dict[str, any]:
+        """
+        Generate comprehensive matching report.
+        
+        Args:
+            year (int): Year to report on
+            improved_results (pd.DataFrame, optional): improved_matching results for the year,
+                if the caller already has them
+            unmatched_analysis (Dict, optional): analyze_unmatched_records results for the year,
+                if the caller already has them
+            
+        Returns:
+            Dict containing match statistics, the unmatched analysis and recommendations
+        """
         logger.info(f"Generating matching report for {year}...")
         
-        # Get both original and improved matching results
+        # Get both original and improved matching results, matching the year only once
         original_results = self.data_processor.match_members(year)
-        improved_results = self.improved_matching(year)
+        if improved_results is None:
+            improved_results = self.improved_matching(year, original_results=original_results)
         
         # Get unmatched analysis
-        unmatched_analysis = self.analyze_unmatched_records(year)
+        if unmatched_analysis is None:
+            unmatched_analysis = self.analyze_unmatched_records(year)
         
         # Calculate improvements
         original_matched = len(original_results[original_results['retention_status'] != 'Unknown'])
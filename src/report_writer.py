@@ -0,0 +1,49 @@
+"""
+Report Writing Utilities for WSA Retention Analysis
+
+This module serializes analysis results to JSON report files.
+"""
+
+from pathlib import Path
+from typing import Any, Union
+import orjson
+
+# orjson handles numpy scalars natively; default=str covers Timestamps and the rest
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Output directories already created by this process
+_ENSURED_DIRS = set()
+
+
+def ensure_dir(directory: Union[str, Path]) -> Path:
+    """
+    Create an output directory (and parents) once per process.
+    
+    Args:
+        directory (Union[str, Path]): Directory to create
+        
+    Returns:
+        Path: The directory, as a Path
+    """
+    directory = Path(directory)
+    if directory not in _ENSURED_DIRS:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+    return directory
+
+
+def save_json_report(payload: Any, filepath: Union[str, Path]) -> Path:
+    """
+    Serialize a report to JSON and write it in a single call.
+    
+    Args:
+        payload (Any): Report data (dicts, lists, numpy/pandas scalars)
+        filepath (Union[str, Path]): Destination file; missing parent directories are created
+        
+    Returns:
+        Path: Path to the written file
+    """
+    filepath = Path(filepath)
+    ensure_dir(filepath.parent)
+    filepath.write_bytes(orjson.dumps(payload, default=str, option=JSON_OPTIONS))
+    return filepath
@@ -8,32 +8,55 @@ and generating comprehensive reports.
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional
+import sys
+import heapq
 import logging
-from pathlib import Path
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import json
 
 from data_processor import DataProcessor
+from report_writer import ensure_dir, save_json_report
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matched-data columns used by the retention analysis and kept in matched_data
+ANALYSIS_COLUMNS = [
+    'Institution of Study', 'Program of Study', 'Country of Origin', 'enrollment_date',
+    'retention_status', 'match_type', 'match_confidence'
+]
+
+# Low-cardinality label columns of the matched data, stored as categories for grouping
+CATEGORY_COLUMNS = [
+    'Institution of Study', 'Program of Study', 'Country of Origin', 'retention_status', 'match_type'
+]
+
+# Lower edges of the low (> 0), medium and high match confidence buckets
+CONFIDENCE_BUCKET_EDGES = [np.nextafter(0, 1), 80, 95]
+
+# Retention statuses counted in the institution, program and country breakdowns
+BREAKDOWN_STATUSES = ['Still in PEI', 'No longer in PEI', 'Inconclusive', 'Unknown']
+
 
 class RetentionAnalyzer:
     """
     Main class for performing retention analysis on WSA member data.
     """
     
-    def __init__(self, data_dir: str = "data/raw"):
+    def __init__(self, data_dir: str = "data/raw", data_files: Optional[Dict[str, str]] = None):
         """
         Initialize the RetentionAnalyzer.
         
         Args:
             data_dir (str): Directory containing the raw CSV files
+            data_files (Dict[str, str], optional): File names overriding the default raw file names
         """
-        self.data_processor = DataProcessor(data_dir)
+        self.data_processor = DataProcessor(data_dir, data_files=data_files)
         self.matched_data = {}
+        # analyze_retention results per year, kept until the data is preprocessed again
+        self._results_cache: Dict[int, Dict[str, any]] = {}
         
     def load_and_preprocess_data(self) -> Dict[str, pd.DataFrame]:
         """
@@ -43,34 +66,50 @@ class RetentionAnalyzer:
             Dict[str, pd.DataFrame]: Preprocessed datasets
         """
         logger.info("Loading and preprocessing data for retention analysis...")
+        self._results_cache.clear()
         return self.data_processor.preprocess_data()
     
-    def analyze_retention(self, year: int) -> Dict[str, any]:
+    def analyze_retention(self, year: int, include_sample: bool = False) -> Dict[str, any]:
         """
         Perform comprehensive retention analysis for a specific year.
         
+        Results are cached per year until the data is preprocessed again; each call
+        returns its own copy, so callers may modify it freely.
+        
         Args:
             year (int): Year to analyze (2023 or 2024)
+            include_sample (bool): Add the first 10 matched rows of the analyzed columns,
+                column by column, as 'raw_data_sample'
             
         Returns:
             Dict[str, any]: Comprehensive analysis results
         """
-        logger.info(f"Starting retention analysis for {year}...")
-        
         # Ensure data is loaded
         if self.data_processor.retention_survey is None:
             self.load_and_preprocess_data()
         
-        # Match members with retention survey
-        matched_data = self.data_processor.match_members(year)
+        if year in self._results_cache:
+            logger.info(f"Using cached retention analysis for {year}")
+            return self._copy_results(year, include_sample)
+        
+        logger.info(f"Starting retention analysis for {year}...")
+        
+        # Match members with retention survey, keeping only the columns analyzed here; the
+        # frame is this analysis' own copy, so its repeated labels can be stored as categories
+        # and its whole-point confidence scores (0-100) as the smallest integer type
+        matched_data = self.data_processor.match_members(year)[ANALYSIS_COLUMNS]
+        for column in CATEGORY_COLUMNS:
+            matched_data[column] = matched_data[column].astype('category')
+        matched_data['match_confidence'] = pd.to_numeric(matched_data['match_confidence'], downcast='integer')
         self.matched_data[year] = matched_data
         
         # Calculate basic statistics
         total_members = len(matched_data)
-        matched_members = len(matched_data[matched_data['retention_status'] != 'Unknown'])
+        matched_mask = matched_data['retention_status'].ne('Unknown').to_numpy()
+        matched_members = int(matched_mask.sum())
         
         # Count retention statuses
-        status_counts = matched_data['retention_status'].value_counts()
+        status_counts = self._label_counts(matched_data['retention_status'])
         
         # Calculate percentages (based on matched members)
         if matched_members > 0:
@@ -95,7 +134,7 @@ class RetentionAnalyzer:
         country_breakdown = self._analyze_by_country(matched_data)
         
         # Match quality analysis
-        match_quality = self._analyze_match_quality(matched_data)
+        match_quality = self._analyze_match_quality(matched_data, matched_mask)
         
         # Timeline analysis
         timeline_analysis = self._analyze_timeline(matched_data, year)
@@ -119,47 +158,143 @@ class RetentionAnalyzer:
             'program_breakdown': program_breakdown,
             'country_breakdown': country_breakdown,
             'match_quality': match_quality,
-            'timeline_analysis': timeline_analysis,
-            'raw_data_sample': matched_data.head(10).to_dict('records')
+            'timeline_analysis': timeline_analysis
         }
         
         logger.info(f"Retention analysis completed for {year}")
+        self._results_cache[year] = results
+        return self._copy_results(year, include_sample)
+    
+    def analyze_years(self, years: Tuple[int, ...] = (2023, 2024), include_sample: bool = False) -> Dict[int, Dict]:
+        """
+        Run analyze_retention for several years in parallel threads.
+        
+        Years use disjoint registration files, so their analyses are independent. The data
+        is preprocessed once here, before the threads start; the threads share this
+        analyzer, so each year's results and matched data stay cached for later calls.
+        
+        Args:
+            years (Tuple[int, ...]): Years to analyze
+            include_sample (bool): Passed on to analyze_retention
+            
+        Returns:
+            Dict[int, Dict]: Analysis results per year
+        """
+        if self.data_processor.retention_survey is None:
+            self.load_and_preprocess_data()
+        
+        with ThreadPoolExecutor(max_workers=len(years)) as executor:
+            futures = {year: executor.submit(self.analyze_retention, year, include_sample) for year in years}
+            return {year: future.result() for year, future in futures.items()}
+    
+    def _copy_results(self, year: int, include_sample: bool) -> Dict[str, any]:
+        """Copy a year's cached results, adding the raw data sample if requested."""
+        results = copy.deepcopy(self._results_cache[year])
+        if include_sample:
+            results['raw_data_sample'] = self.matched_data[year].head(10).to_dict('list')
         return results
     
-    def _analyze_by_institution(self, data: pd.DataFrame) -> Dict[str, Dict]:
+    def _label_counts(self, labels: pd.Series) -> Dict[str, int]:
         """
-        Analyze retention by institution.
+        Count each label with one bincount over its category codes.
         
         Args:
-            data (pd.DataFrame): Matched member data
+            labels (pd.Series): Label per member; missing labels are not counted
             
         Returns:
-            Dict[str, Dict]: Institution-wise retention breakdown
+            Dict[str, int]: Count per label, most common first (ties in category order)
         """
-        institution_analysis = {}
+        labels = labels.astype('category')
+        codes = labels.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels.cat.categories))
+        order = np.argsort(-counts, kind='stable')
+        return dict(zip(labels.cat.categories[order].tolist(), counts[order].tolist()))
+    
+    def _status_count_matrix(self, groups: pd.Series, statuses: pd.Series) -> pd.DataFrame:
+        """
+        Count members per (group, retention status) with one bincount over category codes.
+        
+        Each member's group and status codes are packed into one flat index, so the whole
+        table is a single linear pass with no hashing.
         
-        for institution in data['Institution of Study'].dropna().unique():
-            inst_data = data[data['Institution of Study'] == institution]
-            total = len(inst_data)
+        Args:
+            groups (pd.Series): Group label per member; members without one are not counted
+            statuses (pd.Series): Retention status per member
             
-            status_counts = inst_data['retention_status'].value_counts()
-            matched = len(inst_data[inst_data['retention_status'] != 'Unknown'])
+        Returns:
+            pd.DataFrame: One row per group category and one column per status category,
+            plus 'total_members', which also counts members with a missing status
+        """
+        groups = groups.astype('category')
+        statuses = statuses.astype('category')
+        group_codes = groups.cat.codes.to_numpy().astype(np.int64)
+        status_codes = statuses.cat.codes.to_numpy().astype(np.int64) + 1  # 0 is a missing status
+        width = len(statuses.cat.categories) + 1
+        
+        counted = group_codes >= 0
+        counts = np.bincount(group_codes[counted] * width + status_codes[counted],
+                             minlength=len(groups.cat.categories) * width).reshape(-1, width)
+        
+        matrix = pd.DataFrame(counts[:, 1:], index=groups.cat.categories, columns=statuses.cat.categories)
+        matrix['total_members'] = counts.sum(axis=1)
+        return matrix
+    
+    def _retention_breakdown(self, data: pd.DataFrame, column: str, groups) -> Dict[str, Dict]:
+        """
+        Count retention statuses for each group of a column in a single pass.
+        
+        Groups without any matched members are left out.
+        
+        Args:
+            data (pd.DataFrame): Matched member data
+            column (str): Column to group members by
+            groups: Group values to report, in report order
             
-            if matched > 0:
-                still_in_pei = status_counts.get('Still in PEI', 0)
-                no_longer = status_counts.get('No longer in PEI', 0)
-                inconclusive = status_counts.get('Inconclusive', 0)
-                
-                institution_analysis[institution] = {
+        Returns:
+            Dict[str, Dict]: Per group, member and status counts and the retention rate
+        """
+        status_counts = self._status_count_matrix(data[column], data['retention_status']).reindex(
+            index=groups, columns=BREAKDOWN_STATUSES + ['total_members'], fill_value=0)
+        totals = status_counts['total_members']
+        matched = totals - status_counts['Unknown']
+        
+        breakdown = {}
+        for group, total, matched_members, still_in_pei, no_longer, inconclusive in zip(
+                groups, totals.tolist(), matched.tolist(), status_counts['Still in PEI'].tolist(),
+                status_counts['No longer in PEI'].tolist(), status_counts['Inconclusive'].tolist()):
+            if matched_members > 0:
+                breakdown[group] = {
                     'total_members': total,
-                    'matched_members': matched,
+                    'matched_members': matched_members,
                     'still_in_pei': still_in_pei,
                     'no_longer_in_pei': no_longer,
                     'inconclusive': inconclusive,
-                    'still_in_pei_percent': (still_in_pei / matched * 100),
-                    'retention_rate': (still_in_pei / matched * 100)
+                    'retention_rate': (still_in_pei / matched_members * 100)
                 }
         
+        return breakdown
+    
+    def _analyze_by_institution(self, data: pd.DataFrame) -> Dict[str, Dict]:
+        """
+        Analyze retention by institution.
+        
+        Args:
+            data (pd.DataFrame): Matched member data
+            
+        Returns:
+            Dict[str, Dict]: Institution-wise retention breakdown
+        """
+        institutions = data['Institution of Study'].dropna().unique()
+        institution_analysis = {}
+        
+        for institution, stats in self._retention_breakdown(data, 'Institution of Study', institutions).items():
+            retention_rate = stats.pop('retention_rate')
+            institution_analysis[institution] = {
+                **stats,
+                'still_in_pei_percent': retention_rate,
+                'retention_rate': retention_rate
+            }
+        
         return institution_analysis
     
     def _analyze_by_program(self, data: pd.DataFrame) -> Dict[str, Dict]:
@@ -172,34 +307,11 @@ class RetentionAnalyzer:
         Returns:
             Dict[str, Dict]: Program-wise retention breakdown
         """
-        program_analysis = {}
-        
         # Get top programs (with at least 5 members)
         program_counts = data['Program of Study'].value_counts()
         top_programs = program_counts[program_counts >= 5].index
         
-        for program in top_programs:
-            prog_data = data[data['Program of Study'] == program]
-            total = len(prog_data)
-            
-            status_counts = prog_data['retention_status'].value_counts()
-            matched = len(prog_data[prog_data['retention_status'] != 'Unknown'])
-            
-            if matched > 0:
-                still_in_pei = status_counts.get('Still in PEI', 0)
-                no_longer = status_counts.get('No longer in PEI', 0)
-                inconclusive = status_counts.get('Inconclusive', 0)
-                
-                program_analysis[program] = {
-                    'total_members': total,
-                    'matched_members': matched,
-                    'still_in_pei': still_in_pei,
-                    'no_longer_in_pei': no_longer,
-                    'inconclusive': inconclusive,
-                    'retention_rate': (still_in_pei / matched * 100)
-                }
-        
-        return program_analysis
+        return self._retention_breakdown(data, 'Program of Study', top_programs)
     
     def _analyze_by_country(self, data: pd.DataFrame) -> Dict[str, Dict]:
         """
@@ -211,55 +323,38 @@ class RetentionAnalyzer:
         Returns:
             Dict[str, Dict]: Country-wise retention breakdown
         """
-        country_analysis = {}
-        
         # Get top countries (with at least 3 members)
         country_counts = data['Country of Origin'].value_counts()
         top_countries = country_counts[country_counts >= 3].index
         
-        for country in top_countries:
-            country_data = data[data['Country of Origin'] == country]
-            total = len(country_data)
-            
-            status_counts = country_data['retention_status'].value_counts()
-            matched = len(country_data[country_data['retention_status'] != 'Unknown'])
-            
-            if matched > 0:
-                still_in_pei = status_counts.get('Still in PEI', 0)
-                no_longer = status_counts.get('No longer in PEI', 0)
-                inconclusive = status_counts.get('Inconclusive', 0)
-                
-                country_analysis[country] = {
-                    'total_members': total,
-                    'matched_members': matched,
-                    'still_in_pei': still_in_pei,
-                    'no_longer_in_pei': no_longer,
-                    'inconclusive': inconclusive,
-                    'retention_rate': (still_in_pei / matched * 100)
-                }
-        
-        return country_analysis
+        return self._retention_breakdown(data, 'Country of Origin', top_countries)
     
-    def _analyze_match_quality(self, data: pd.DataFrame) -> Dict[str, any]:
+    def _analyze_match_quality(self, data: pd.DataFrame, matched_mask: np.ndarray) -> Dict[str, any]:
         """
         Analyze the quality of member matching.
         
         Args:
             data (pd.DataFrame): Matched member data
+            matched_mask (np.ndarray): Rows whose retention status is known
             
         Returns:
             Dict[str, any]: Match quality statistics
         """
-        match_types = data['match_type'].value_counts()
-        total_matches = len(data[data['retention_status'] != 'Unknown'])
+        match_types = self._label_counts(data['match_type'])
+        total_matches = int(matched_mask.sum())
+        
+        # Bucket every confidence in one pass: none (0), low, medium (80-94) and high (95+)
+        confidence = data['match_confidence'].to_numpy(dtype=np.float64, na_value=0)
+        _, low, medium, high = np.bincount(
+            np.digitize(confidence, CONFIDENCE_BUCKET_EDGES), minlength=4).tolist()
         
         quality_analysis = {
             'total_matches': total_matches,
-            'match_type_breakdown': match_types.to_dict(),
-            'average_confidence': data[data['retention_status'] != 'Unknown']['match_confidence'].mean(),
-            'high_confidence_matches': len(data[data['match_confidence'] >= 95]),
-            'medium_confidence_matches': len(data[(data['match_confidence'] >= 80) & (data['match_confidence'] < 95)]),
-            'low_confidence_matches': len(data[(data['match_confidence'] < 80) & (data['match_confidence'] > 0)])
+            'match_type_breakdown': match_types,
+            'average_confidence': data['match_confidence'][matched_mask].mean(),
+            'high_confidence_matches': high,
+            'medium_confidence_matches': medium,
+            'low_confidence_matches': low
         }
         
         return quality_analysis
@@ -275,34 +370,35 @@ class RetentionAnalyzer:
         Returns:
             Dict[str, any]: Timeline analysis
         """
-        # Filter data with valid enrollment dates
-        timeline_data = data[data['enrollment_date'].notna()].copy()
-        timeline_data['enrollment_month'] = timeline_data['enrollment_date'].dt.month
+        # Count enrollments and statuses per enrollment month in one bincount pass; members
+        # without a valid enrollment date have no month and are left out
+        months = data['enrollment_date'].dt.month
+        status_counts = self._status_count_matrix(months, data['retention_status']).reindex(
+            columns=['Still in PEI', 'Unknown', 'total_members'], fill_value=0)
+        month_totals = status_counts['total_members']
+        matched = month_totals - status_counts['Unknown']
         
         monthly_analysis = {}
         
-        for month in range(1, 13):
-            month_data = timeline_data[timeline_data['enrollment_month'] == month]
-            if len(month_data) > 0:
-                status_counts = month_data['retention_status'].value_counts()
-                matched = len(month_data[month_data['retention_status'] != 'Unknown'])
-                
-                if matched > 0:
-                    still_in_pei = status_counts.get('Still in PEI', 0)
-                    retention_rate = (still_in_pei / matched * 100)
-                else:
-                    retention_rate = 0
-                
-                monthly_analysis[month] = {
-                    'total_enrollments': len(month_data),
-                    'matched_members': matched,
-                    'retention_rate': retention_rate
-                }
+        for month, total, matched_members, still_in_pei in zip(
+                month_totals.index.astype(int).tolist(), month_totals.tolist(), matched.tolist(),
+                status_counts['Still in PEI'].tolist()):
+            if matched_members > 0:
+                retention_rate = (still_in_pei / matched_members * 100)
+            else:
+                retention_rate = 0
+            
+            monthly_analysis[month] = {
+                'total_enrollments': total,
+                'matched_members': matched_members,
+                'retention_rate': retention_rate
+            }
         
+        total_with_dates = int(month_totals.sum())
         return {
             'monthly_breakdown': monthly_analysis,
-            'total_with_dates': len(timeline_data),
-            'missing_dates': len(data) - len(timeline_data)
+            'total_with_dates': total_with_dates,
+            'missing_dates': len(data) - total_with_dates
         }
     
     def print_summary(self, results: Dict[str, any], year: int) -> None:
@@ -315,35 +411,43 @@ class RetentionAnalyzer:
         """
         summary = results['summary']
         
-        print(f"\n{'='*60}")
-        print(f"WSA RETENTION ANALYSIS SUMMARY - {year}")
-        print(f"{'='*60}")
-        
-        print(f"\nOVERALL STATISTICS:")
-        print(f"  Total Registered Members: {summary['total_registered_members']:,}")
-        print(f"  Members with Retention Data: {summary['members_with_retention_data']:,}")
-        print(f"  Match Rate: {summary['match_rate_percent']:.1f}%")
-        
-        print(f"\nRETENTION BREAKDOWN:")
-        print(f"  Still in PEI: {summary['still_in_pei']:,} ({summary['still_in_pei_percent']:.1f}%)")
-        print(f"  No Longer in PEI: {summary['no_longer_in_pei']:,} ({summary['no_longer_in_pei_percent']:.1f}%)")
-        print(f"  Inconclusive: {summary['inconclusive']:,} ({summary['inconclusive_percent']:.1f}%)")
-        print(f"  Unknown: {summary['unknown']:,}")
+        # Build the whole summary first and write it to stdout in one call
+        lines = [
+            f"\n{'='*60}",
+            f"WSA RETENTION ANALYSIS SUMMARY - {year}",
+            f"{'='*60}",
+            
+            f"\nOVERALL STATISTICS:",
+            f"  Total Registered Members: {summary['total_registered_members']:,}",
+            f"  Members with Retention Data: {summary['members_with_retention_data']:,}",
+            f"  Match Rate: {summary['match_rate_percent']:.1f}%",
+            
+            f"\nRETENTION BREAKDOWN:",
+            f"  Still in PEI: {summary['still_in_pei']:,} ({summary['still_in_pei_percent']:.1f}%)",
+            f"  No Longer in PEI: {summary['no_longer_in_pei']:,} ({summary['no_longer_in_pei_percent']:.1f}%)",
+            f"  Inconclusive: {summary['inconclusive']:,} ({summary['inconclusive_percent']:.1f}%)",
+            f"  Unknown: {summary['unknown']:,}",
+            
+            f"\nTOP INSTITUTIONS BY RETENTION RATE:"
+        ]
         
-        print(f"\nTOP INSTITUTIONS BY RETENTION RATE:")
         inst_data = results['institution_breakdown']
-        sorted_institutions = sorted(inst_data.items(), key=lambda x: x[1]['retention_rate'], reverse=True)
+        top_institutions = heapq.nlargest(5, inst_data.items(), key=lambda x: x[1]['retention_rate'])
         
-        for i, (institution, data) in enumerate(sorted_institutions[:5]):
-            print(f"  {i+1}. {institution}: {data['retention_rate']:.1f}% ({data['still_in_pei']}/{data['matched_members']})")
+        for i, (institution, data) in enumerate(top_institutions):
+            lines.append(f"  {i+1}. {institution}: {data['retention_rate']:.1f}% ({data['still_in_pei']}/{data['matched_members']})")
         
-        print(f"\nMATCH QUALITY:")
         match_quality = results['match_quality']
-        print(f"  Average Confidence: {match_quality['average_confidence']:.1f}%")
-        print(f"  High Confidence Matches (95%+): {match_quality['high_confidence_matches']:,}")
-        print(f"  Medium Confidence Matches (80-94%): {match_quality['medium_confidence_matches']:,}")
+        lines.extend([
+            f"\nMATCH QUALITY:",
+            f"  Average Confidence: {match_quality['average_confidence']:.1f}%",
+            f"  High Confidence Matches (95%+): {match_quality['high_confidence_matches']:,}",
+            f"  Medium Confidence Matches (80-94%): {match_quality['medium_confidence_matches']:,}",
+            
+            f"\n{'='*60}"
+        ])
         
-        print(f"\n{'='*60}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def save_results(self, results: Dict[str, any], filename: str = None) -> str:
         """
@@ -361,13 +465,8 @@ class RetentionAnalyzer:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"retention_analysis_{year}_{timestamp}.json"
         
-        output_dir = Path("reports")
-        output_dir.mkdir(exist_ok=True)
-        
-        filepath = output_dir / filename
-        
-        with open(filepath, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # orjson encodes the numpy scalars in the breakdowns natively and writes bytes directly
+        filepath = save_json_report(results, ensure_dir("reports") / filename)
         
         logger.info(f"Results saved to {filepath}")
         return str(filepath)
@@ -402,40 +501,37 @@ class RetentionAnalyzer:
     
     def _compare_institutions(self, results_2023: Dict, results_2024: Dict) -> Dict[str, Dict]:
         """Compare institution retention rates between years."""
-        inst_2023 = results_2023['institution_breakdown']
-        inst_2024 = results_2024['institution_breakdown']
-        
-        comparison = {}
-        all_institutions = set(inst_2023.keys()) | set(inst_2024.keys())
-        
-        for institution in all_institutions:
-            rate_2023 = inst_2023.get(institution, {}).get('retention_rate', 0)
-            rate_2024 = inst_2024.get(institution, {}).get('retention_rate', 0)
-            
-            comparison[institution] = {
-                '2023_retention_rate': rate_2023,
-                '2024_retention_rate': rate_2024,
-                'change': rate_2024 - rate_2023
-            }
-        
-        return comparison
+        return self._compare_retention_rates(results_2023['institution_breakdown'],
+                                             results_2024['institution_breakdown'])
     
     def _compare_countries(self, results_2023: Dict, results_2024: Dict) -> Dict[str, Dict]:
         """Compare country retention rates between years."""
-        country_2023 = results_2023['country_breakdown']
-        country_2024 = results_2024['country_breakdown']
+        return self._compare_retention_rates(results_2023['country_breakdown'],
+                                             results_2024['country_breakdown'])
+    
+    def _compare_retention_rates(self, breakdown_2023: Dict, breakdown_2024: Dict) -> Dict[str, Dict]:
+        """
+        Compare the retention rate of each group between two yearly breakdowns.
         
+        Groups missing from a year count as a 0% retention rate for that year.
+        
+        Args:
+            breakdown_2023 (Dict): 2023 breakdown, keyed by group
+            breakdown_2024 (Dict): 2024 breakdown, keyed by group
+            
+        Returns:
+            Dict[str, Dict]: Per group (2023 groups first), both rates and the change
+        """
         comparison = {}
-        all_countries = set(country_2023.keys()) | set(country_2024.keys())
         
-        for country in all_countries:
-            rate_2023 = country_2023.get(country, {}).get('retention_rate', 0)
-            rate_2024 = country_2024.get(country, {}).get('retention_rate', 0)
+        for group in {**dict.fromkeys(breakdown_2023), **dict.fromkeys(breakdown_2024)}:
+            rate_2023 = breakdown_2023[group]['retention_rate'] if group in breakdown_2023 else 0
+            rate_2024 = breakdown_2024[group]['retention_rate'] if group in breakdown_2024 else 0
             
-            comparison[country] = {
+            comparison[group] = {
                 '2023_retention_rate': rate_2023,
                 '2024_retention_rate': rate_2024,
                 'change': rate_2024 - rate_2023
             }
         
-        return comparison 
\ No newline at end of file
+        return comparison